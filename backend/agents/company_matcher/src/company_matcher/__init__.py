@@ -1,6 +1,13 @@
 """Company Matcher Agent - finds exact or closest matches for company names."""
 
-from .graph import company_matcher
-
 __all__ = ["company_matcher"]
 
+
+def __getattr__(name: str):
+    # Build the graph on first access so importing company_matcher.models or
+    # company_matcher.state does not pay for the model, prompts and tools.
+    if name == "company_matcher":
+        from .graph import company_matcher
+
+        return company_matcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
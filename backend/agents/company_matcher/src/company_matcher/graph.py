@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import os
 import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
-from jinja2 import Environment, FileSystemLoader
+import orjson
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
+from minijinja import Environment
 
 from company_matcher.models import CompanyMatch, CompanyMatchResult
 from company_matcher.state import CompanyMatcherInputState, CompanyMatcherState
@@ -33,17 +35,16 @@ from tools import tavily_search_tool
 
 PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
 
-_jinja_env = Environment(
-    loader=FileSystemLoader(str(PROMPTS_DIR)),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
+# MiniJinja (Rust-backed) renders the same Jinja dialect used by our prompts;
+# loaded templates are compiled once and cached inside the environment.
+_jinja_env = Environment(loader=lambda name: (PROMPTS_DIR / name).read_text(encoding="utf-8"))
+_jinja_env.trim_blocks = True
+_jinja_env.lstrip_blocks = True
 
 
 def load_prompt(template_name: str, **kwargs) -> str:
-    """Load and render a Jinja2 prompt template."""
-    template = _jinja_env.get_template(template_name)
-    return template.render(**kwargs)
+    """Load and render a Jinja prompt template."""
+    return _jinja_env.render_template(template_name, **kwargs)
 
 
 # =============================================================================
@@ -108,22 +109,50 @@ def finish_matching(result_json: str) -> str:
 MAX_ITERATIONS = 1
 MAX_SUGGESTIONS = 3
 MAX_QUERIES_PER_CALL = 5  # Maximum queries per web_search call
+MAX_OUTPUT_TOKENS = 2000  # Bounds decode time; leaves room for summary_long
 
 
 def _extract_company_name(messages: list) -> str:
     """Extract company name from the last human message."""
+    # Walks from the tail and stops at the first hit, so the usual case (the
+    # input HumanMessage is the last message) touches a single element.
     for message in reversed(messages):
-        if isinstance(message, HumanMessage):
-            if isinstance(message.content, str) and message.content.strip():
-                return message.content.strip()
+        # Compare the type tag rather than isinstance(): no MRO walk per message.
+        if message.type == "human" and isinstance(message.content, str):
+            name = message.content.strip()
+            if name:
+                return name
     raise ValueError("No company name found. Please provide the company name.")
 
 
 TOOLS = [web_search, finish_matching]
 tool_node = ToolNode(TOOLS)
 
+# OpenAI tool specs are derived from signatures/docstrings; do it once at import.
+_TOOL_SPECS = [convert_to_openai_tool(t) for t in TOOLS]
+
+
+@functools.lru_cache(maxsize=8)
+def _get_model(api_key: str | None, base_url: str | None):
+    """Return a tool-bound chat model, shared across invocations per credential pair.
+
+    Reusing the client keeps its HTTP connection pool warm and avoids
+    regenerating the tool schemas on every agent step.
+    """
+    return ChatOpenAI(
+        model="deepseek-chat",
+        api_key=api_key,
+        base_url=base_url,
+        max_tokens=MAX_OUTPUT_TOKENS,
+    ).bind_tools(_TOOL_SPECS)
+
+
+@functools.lru_cache(maxsize=1024)
 def _to_top_domain(value: str) -> str:
-    """Normalize a URL/domain-ish string into a top-domain hostname."""
+    """Normalize a URL/domain-ish string into a top-domain hostname.
+
+    Memoized: the same site often appears in both exact_match and suggestions.
+    """
     v = (value or "").strip()
     if not v:
         return ""
@@ -170,42 +199,95 @@ async def run_agent(
     api_key = api_keys.get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
     base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
 
-    model = ChatOpenAI(
-        model="deepseek-chat",
-        api_key=api_key,
-        base_url=base_url,
-    ).bind_tools(TOOLS)
-
+    model = _get_model(api_key, base_url)
     response = await model.ainvoke(state["messages"], config=config)
     return {"messages": [response]}
 
 
-def _parse_result_from_messages(messages: list[BaseMessage | str]) -> str:
-    """Extract the most recent result JSON payload from the conversation.
+def route_after_tools(state: CompanyMatcherState) -> str:
+    """Go straight to finalize once finish_matching has run.
+
+    The finish_matching ToolMessage already carries the result JSON, so sending
+    it back to the agent would only spend another LLM call acknowledging it.
+    """
+    for message in reversed(state.get("messages", [])):
+        if isinstance(message, AIMessage):
+            if any(tc.get("name") == "finish_matching" for tc in message.tool_calls):
+                return "finalize"
+            break
+    return "agent"
+
+
+def _matching_open_brace(text: str, close: int) -> int:
+    """Walk back from the "}" at `close` to its matching "{" (string-aware), or -1."""
+    depth = 0
+    in_string = False
+    i = close
+    while i >= 0:
+        ch = text[i]
+        if ch == '"':
+            backslashes = 0
+            j = i - 1
+            while j >= 0 and text[j] == "\\":
+                backslashes += 1
+                j -= 1
+            if backslashes % 2 == 0:
+                in_string = not in_string
+        elif not in_string:
+            if ch == "}":
+                depth += 1
+            elif ch == "{":
+                depth -= 1
+                if depth == 0:
+                    return i
+        i -= 1
+    return -1
+
+
+def _find_result_payload(messages: list[BaseMessage | str]) -> tuple[str, dict] | None:
+    """Return the most recent result JSON payload and its parsed form, if any.
 
     Important: the initial prompt includes JSON examples, so we ignore HumanMessages
     and only accept payloads that look like the real output schema.
     """
     for message in reversed(messages):
-        if isinstance(message, HumanMessage):
+        if getattr(message, "type", None) == "human":
             continue
         content = getattr(message, "content", message)
         if not isinstance(content, str):
             continue
-        if "{" not in content:
-            continue
         # Heuristic: require the expected keys to avoid parsing the prompt examples.
-        if '"exact_match"' not in content or '"suggestions"' not in content:
+        # Most tool/AI messages are plain search results, so bail out on the first
+        # failed probe before doing any further scanning.
+        key_pos = content.find('"exact_match"')
+        if key_pos < 0 or '"suggestions"' not in content:
+            continue
+        json_start = content.find("{", 0, key_pos)
+        if json_start < 0:
             continue
-        json_start = content.find("{")
         json_end = content.rfind("}") + 1
         candidate = content[json_start:json_end]
         try:
-            json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-        return candidate
-    return "{}"
+            parsed = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            # Leading chatter may contain its own braces; retry with the object
+            # that actually closes at the final "}".
+            json_start = _matching_open_brace(content, json_end - 1)
+            if json_start < 0 or json_start > key_pos:
+                continue
+            candidate = content[json_start:json_end]
+            try:
+                parsed = orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                continue
+        return candidate, parsed
+    return None
+
+
+def _parse_result_from_messages(messages: list[BaseMessage | str]) -> str:
+    """Extract the most recent result JSON payload from the conversation."""
+    found = _find_result_payload(messages)
+    return found[0] if found else "{}"
 
 
 async def finalize_result(
@@ -213,12 +295,9 @@ async def finalize_result(
 ) -> dict:
     """Normalize the agent output to the expected CompanyMatchResult."""
     company_name = state.get("company_name", "")
-    raw_json = _parse_result_from_messages(state.get("messages", []))
-
-    try:
-        parsed = json.loads(raw_json)
-    except json.JSONDecodeError:
-        parsed = {"exact_match": None, "suggestions": []}
+    # Reuse the dict parsed while locating the payload instead of parsing twice.
+    found = _find_result_payload(state.get("messages", []))
+    parsed = found[1] if found else {"exact_match": None, "suggestions": []}
 
     def _normalize_match_dict(d: dict) -> dict:
         # Accept legacy "url" and convert to top_domain if needed.
@@ -253,10 +332,11 @@ async def finalize_result(
 
     exact_match = None
     if parsed.get("exact_match"):
-        exact_match = CompanyMatch(**_normalize_match_dict(parsed["exact_match"]))
+        exact_match = CompanyMatch.model_validate(_normalize_match_dict(parsed["exact_match"]))
 
     suggestions = [
-        CompanyMatch(**_normalize_match_dict(s)) for s in parsed.get("suggestions", [])
+        CompanyMatch.model_validate(_normalize_match_dict(s))
+        for s in parsed.get("suggestions", [])
     ]
 
     result = CompanyMatchResult(
@@ -297,7 +377,14 @@ _builder.add_conditional_edges(
         END: "finalize",
     },
 )
-_builder.add_edge("tools", "agent")
+_builder.add_conditional_edges(
+    "tools",
+    route_after_tools,
+    {
+        "agent": "agent",
+        "finalize": "finalize",
+    },
+)
 _builder.add_edge("finalize", END)
 
 # Export the compiled graph
@@ -0,0 +1,83 @@
+"""Redis cache for per-question research answers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Optional
+
+from company_researcher.models import SubQuestionAnswer
+
+# TTL in seconds (7 days)
+ANSWER_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Bump whenever a question template, summarize.jinja or the answer parsing
+# changes, so answers produced by the old prompts stop being served.
+PROMPT_VERSION = "2"
+
+
+def _get_redis_client():
+    # Reuse the shared Tavily cache connection. `tools` is importable once
+    # company_researcher.researcher has put backend/agents on sys.path.
+    from tools.cache import get_redis_client
+
+    return get_redis_client()
+
+
+def make_answer_key(
+    *,
+    research_model: str,
+    summarization_model: str,
+    company_name: str,
+    top_domain: str | None,
+    summary_long: str | None,
+    prompt_template: str,
+    question: str,
+) -> str:
+    """Create a deterministic cache key for one researched sub-question."""
+    parts = [
+        PROMPT_VERSION,
+        research_model,
+        summarization_model,
+        company_name.strip().lower(),
+        (top_domain or "").strip().lower(),
+        (summary_long or "").strip(),
+        prompt_template,
+        question,
+    ]
+    h = hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+    return f"research:{h}"
+
+
+def get_cached_answers(key: str) -> Optional[list[dict]]:
+    """Get cached completed answers for a sub-question if available.
+
+    Entries are re-validated on the way out (finalize_report trusts them);
+    anything that no longer matches SubQuestionAnswer is treated as a miss.
+    """
+    client = _get_redis_client()
+    if not client:
+        return None
+
+    try:
+        data = client.get(key)
+        if data:
+            return [
+                SubQuestionAnswer.model_validate(a).model_dump()
+                for a in json.loads(data)
+            ]
+    except Exception:
+        pass
+    return None
+
+
+def set_cached_answers(key: str, answers: list[dict]) -> None:
+    """Cache the completed answers for a sub-question."""
+    client = _get_redis_client()
+    if not client:
+        return
+
+    try:
+        client.setex(key, ANSWER_CACHE_TTL, json.dumps(answers))
+    except Exception:
+        pass
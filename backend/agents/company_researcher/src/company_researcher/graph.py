@@ -3,20 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 from pathlib import Path
 from typing import List, Literal
 from urllib.parse import urlparse
 import re
+import weakref
 
-from jinja2 import Environment, FileSystemLoader
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.types import Send
+from minijinja import Environment
 
+from company_researcher.cache import get_cached_answers, make_answer_key, set_cached_answers
 from company_researcher.configuration import Configuration
 from company_researcher.models import (
     CompanyResearchResult,
@@ -39,17 +42,22 @@ from company_researcher.utils import get_api_key_for_model
 
 PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
 
-_jinja_env = Environment(
-    loader=FileSystemLoader(str(PROMPTS_DIR)),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
+# MiniJinja (Rust-backed) renders the same Jinja dialect used by our prompts;
+# loaded templates are compiled once and cached inside the environment.
+_jinja_env = Environment(loader=lambda name: (PROMPTS_DIR / name).read_text(encoding="utf-8"))
+_jinja_env.trim_blocks = True
+_jinja_env.lstrip_blocks = True
 
 
 def load_prompt(template_name: str, **kwargs) -> str:
-    """Load and render a Jinja2 prompt template."""
-    template = _jinja_env.get_template(template_name)
-    return template.render(**kwargs)
+    """Load and render a Jinja prompt template."""
+    return _jinja_env.render_template(template_name, **kwargs)
+
+
+# Patterns used when parsing research traces and summarizer output, compiled
+# once instead of on every parsed line.
+_URL_RE = re.compile(r"https?://[^\\s\\n]+")
+_FLAG_SEPARATORS_RE = re.compile(r"[\s_\-]+")
 
 
 def _infer_source_domain(raw_output: str, top_domain: str | None = None) -> str:
@@ -65,7 +73,7 @@ def _infer_source_domain(raw_output: str, top_domain: str | None = None) -> str:
         return "Unknown"
 
     # Extract URLs (handles both real newlines and escaped \\n sequences).
-    urls = re.findall(r"https?://[^\\s\\n]+", text)
+    urls = _URL_RE.findall(text)
     if not urls:
         return (top_domain or "").strip() or "Unknown"
 
@@ -104,25 +112,25 @@ def _infer_source_domain(raw_output: str, top_domain: str | None = None) -> str:
 
 
 # =============================================================================
-# Subgraph Nodes (Single Question Research)
+# Models
 # =============================================================================
 
-async def research_agent(
-    state: QuestionResearchState, config: RunnableConfig | None = None
-) -> dict:
-    """Agent node that decides to search or finish."""
-    cfg = Configuration.from_runnable_config(config) if config else Configuration()
-    
-    # Get model params
-    model_name = cfg.research_model.replace("openai:", "") if cfg.research_model.startswith("openai:") else cfg.research_model
-    api_key = get_api_key_for_model(cfg.research_model, config)
-    base_url = None
-    if config:
-        api_keys = config.get("configurable", {}).get("apiKeys", {})
-        base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
-    else:
-        base_url = os.getenv("OPENAI_BASE_URL")
-    
+def _model_settings(model_spec: str, config: RunnableConfig | None) -> tuple[str, str | None, str | None]:
+    """Resolve (model name, API key, base URL) for a configured model spec."""
+    model_name = model_spec.removeprefix("openai:")
+    api_key = get_api_key_for_model(model_spec, config)
+    api_keys = config.get("configurable", {}).get("apiKeys", {}) if config else {}
+    base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
+    return model_name, api_key, base_url
+
+
+@functools.lru_cache(maxsize=8)
+def _get_model(model_name: str, api_key: str | None, base_url: str | None) -> ChatOpenAI:
+    """Return a chat model shared by every question and turn using these settings.
+
+    All parallel sub-question agents then go through one HTTP connection pool
+    instead of opening a new client (and TLS session) per call.
+    """
     model_params = {
         "model": model_name,
     }
@@ -130,24 +138,48 @@ async def research_agent(
         model_params["api_key"] = api_key
     if base_url:
         model_params["base_url"] = base_url
-    
-    model = ChatOpenAI(**model_params)
-    tools = get_research_tools()
-    model_with_tools = model.bind_tools(tools)
-    
-    # Prepare messages
-    messages = state.get("messages", [])
-    if not messages:
-        # Initial prompt: each sub-question has its own dedicated template
-        prompt = load_prompt(
-            state["prompt_template"],
-            company_name=state["company_name"],
-            top_domain=state.get("top_domain"),
-            summary_long=state.get("summary_long"),
-            max_iterations=cfg.max_research_iterations,
-        )
+    return ChatOpenAI(**model_params)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_research_model(model_name: str, api_key: str | None, base_url: str | None):
+    """Return the research model with the research tools bound."""
+    return _get_model(model_name, api_key, base_url).bind_tools(get_research_tools())
 
-        messages = [HumanMessage(content=prompt)]
+
+# =============================================================================
+# Subgraph Nodes (Single Question Research)
+# =============================================================================
+
+async def research_agent(
+    state: QuestionResearchState, config: RunnableConfig | None = None
+) -> dict:
+    """Agent node that decides to search or finish."""
+    cfg = Configuration.from_runnable_config(config) if config else Configuration()
+    
+    # Get model params
+    model_with_tools = _get_research_model(*_model_settings(cfg.research_model, config))
+
+    # Prepare messages. Each sub-question has its own dedicated template with no
+    # per-company text, so it is byte-identical across companies and turns and
+    # the provider's prompt cache can serve it; the company context follows.
+    messages = [
+        SystemMessage(
+            content=load_prompt(
+                state["prompt_template"],
+                max_iterations=cfg.max_research_iterations,
+            )
+        ),
+        HumanMessage(
+            content=load_prompt(
+                "company_context.jinja",
+                company_name=state["company_name"],
+                top_domain=state.get("top_domain"),
+                summary_long=state.get("summary_long"),
+            )
+        ),
+        *state.get("messages", []),
+    ]
     
     # Check if this is the last iteration and warn the model
     iterations = state.get("iterations", 0)
@@ -195,24 +227,7 @@ async def summarize_research(
     try:
         cfg = Configuration.from_runnable_config(config) if config else Configuration()
         
-        model_name = cfg.summarization_model.replace("openai:", "") if cfg.summarization_model.startswith("openai:") else cfg.summarization_model
-        api_key = get_api_key_for_model(cfg.summarization_model, config)
-        base_url = None
-        if config:
-            api_keys = config.get("configurable", {}).get("apiKeys", {})
-            base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
-        else:
-            base_url = os.getenv("OPENAI_BASE_URL")
-        
-        model_params = {
-            "model": model_name,
-        }
-        if api_key:
-            model_params["api_key"] = api_key
-        if base_url:
-            model_params["base_url"] = base_url
-        
-        model = ChatOpenAI(**model_params)
+        model = _get_model(*_model_settings(cfg.summarization_model, config))
         
         prompt = load_prompt(
             "summarize.jinja",
@@ -239,7 +254,7 @@ async def summarize_research(
             upper = line_clean.upper()
             if upper.startswith("INFORMATION_FOUND:"):
                 raw_val = line_clean.split(":", 1)[1].strip() if ":" in line_clean else ""
-                norm = re.sub(r"[\s_\-]+", "", raw_val.lower())
+                norm = _FLAG_SEPARATORS_RE.sub("", raw_val.lower())
                 if norm in {"yes", "y", "true", "1", "found"}:
                     information_found = True
                 elif norm in {"no", "n", "false", "0", "notfound"}:
@@ -305,17 +320,25 @@ async def summarize_research(
 
 def _extract_company_name(messages: list) -> str:
     """Extract company name from the last human message."""
+    # Walks from the tail and stops at the first hit, so the usual case (the
+    # input HumanMessage is the last message) touches a single element.
     for message in reversed(messages):
-        if isinstance(message, HumanMessage):
-            if isinstance(message.content, str) and message.content.strip():
-                return message.content.strip()
+        if message.type == "human" and isinstance(message.content, str):
+            name = message.content.strip()
+            if name:
+                return name
     raise ValueError("No company name found. Please provide the company name.")
 
 
+# The question set ships with the package; load and dump it once at import so
+# prepare_research does no file I/O or model serialization per run.
+_SUBQUESTIONS: list[dict] = [sq.model_dump() for sq in load_subquestions_from_templates()]
+
+
 async def prepare_research(
     state: CompanyResearchState, config: RunnableConfig | None = None
 ) -> dict:
-    """Node 1: Extract company name and load sub-questions from templates."""
+    """Node 1: Extract company name and attach the sub-questions to research."""
     company_name = state.get("company_name")
     if not company_name:
         company_name = _extract_company_name(state.get("messages", []))
@@ -323,15 +346,13 @@ async def prepare_research(
     top_domain = (state.get("top_domain") or "").strip()
     summary_long = (state.get("summary_long") or "").strip()
     
-    subquestions = load_subquestions_from_templates()
-
     return {
         "company_name": company_name,
         "top_domain": top_domain,
         "summary_long": summary_long,
-        "subquestions": {"type": "override", "value": [sq.model_dump() for sq in subquestions]},
+        "subquestions": {"type": "override", "value": list(_SUBQUESTIONS)},
         "completed_answers": {"type": "override", "value": []},
-        "messages": [AIMessage(content=f"Starting DSA research for: {company_name}\n\nResearching {len(subquestions)} questions with parallel agents...")]
+        "messages": [AIMessage(content=f"Starting DSA research for: {company_name}\n\nResearching {len(_SUBQUESTIONS)} questions with parallel agents...")]
     }
 
 
@@ -360,14 +381,69 @@ def dispatch_research(state: CompanyResearchState) -> List[Send]:
     ]
 
 
+# One semaphore per configured limit, shared by every Send branch of a run.
+# Keyed by the running loop too: asyncio semaphores are bound to one loop.
+_RESEARCH_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _research_semaphore(limit: int) -> asyncio.Semaphore:
+    limit = max(1, limit)
+    semaphores = _RESEARCH_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    sem = semaphores.get(limit)
+    if sem is None:
+        sem = semaphores[limit] = asyncio.Semaphore(limit)
+    return sem
+
+
+async def research_question(
+    state: QuestionResearchState, config: RunnableConfig | None = None
+) -> dict:
+    """Run the research subgraph for one question, bounded by max_concurrent_research.
+
+    All questions are dispatched up front; a slot frees as soon as any single
+    question finishes, so one slow question never holds back a whole batch.
+    """
+    cfg = Configuration.from_runnable_config(config) if config else Configuration()
+    cache_key = make_answer_key(
+        research_model=cfg.research_model,
+        summarization_model=cfg.summarization_model,
+        company_name=state["company_name"],
+        top_domain=state.get("top_domain"),
+        summary_long=state.get("summary_long"),
+        prompt_template=state["prompt_template"],
+        question=state["question"],
+    )
+    cached = get_cached_answers(cache_key)
+    if cached is not None:
+        return {"completed_answers": cached}
+
+    async with _research_semaphore(cfg.max_concurrent_research):
+        result = await research_subgraph.ainvoke(state, config)
+
+    answers = result.get("completed_answers", [])
+    # Summarizer failures surface as an "Error: ..." summary; don't pin those.
+    if answers and not str(result.get("research_summary", "")).startswith("Error:"):
+        set_cached_answers(cache_key, answers)
+    # Forward the keys the parent state shares with the subgraph, as it would
+    # receive them if the compiled subgraph were mounted directly.
+    return {
+        "messages": result.get("messages", []),
+        "completed_answers": answers,
+    }
+
+
 async def finalize_report(
     state: CompanyResearchState, config: RunnableConfig | None = None
 ) -> dict:
     """Node 3: Compile all answers into final JSON report."""
-    answers = [SubQuestionAnswer(**a) for a in state.get("completed_answers", [])]
+    # Answers were validated when summarize_and_format built them, or by
+    # get_cached_answers when served from Redis; skip re-running the validators.
+    answers = [SubQuestionAnswer.model_construct(**a) for a in state.get("completed_answers", [])]
     company_name = state.get("company_name", "Unknown")
 
-    result = CompanyResearchResult(
+    result = CompanyResearchResult.model_construct(
         company_name=company_name,
         answers=answers,
     )
@@ -466,15 +542,15 @@ def should_continue_with_tools(state: QuestionResearchState, config: RunnableCon
     return "summarize"
 
 
+research_tool_node = ToolNode(get_research_tools())
+
+
 async def tools_with_iteration_counter(
     state: QuestionResearchState, config: RunnableConfig | None = None
 ) -> dict:
     """Wrapper around ToolNode that increments iteration counter."""
-    tools = get_research_tools()
-    tool_node = ToolNode(tools)
-    
-    # Execute tools
-    result = await tool_node.ainvoke(state, config)
+    # ToolNode runs all tool calls of one agent turn concurrently
+    result = await research_tool_node.ainvoke(state, config)
     
     # Increment iteration counter
     current_iterations = state.get("iterations", 0)
@@ -513,16 +589,7 @@ async def summarize_and_format(state: QuestionResearchState, config: RunnableCon
 
     cfg = Configuration.from_runnable_config(config) if config else Configuration()
     # ... (Model setup same as above) ...
-    model_name = cfg.summarization_model.replace("openai:", "") if cfg.summarization_model.startswith("openai:") else cfg.summarization_model
-    api_key = get_api_key_for_model(cfg.summarization_model, config)
-    base_url = None
-    if config:
-        api_keys = config.get("configurable", {}).get("apiKeys", {})
-        base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
-    else:
-        base_url = os.getenv("OPENAI_BASE_URL")
-    
-    model = ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
+    model = _get_model(*_model_settings(cfg.summarization_model, config))
     
     prompt = load_prompt(
         "summarize.jinja",
@@ -549,7 +616,7 @@ async def summarize_and_format(state: QuestionResearchState, config: RunnableCon
         upper = line_clean.upper()
         if upper.startswith("INFORMATION_FOUND:"):
             raw_val = line_clean.split(":", 1)[1].strip() if ":" in line_clean else ""
-            norm = re.sub(r"[\s_\-]+", "", raw_val.lower())
+            norm = _FLAG_SEPARATORS_RE.sub("", raw_val.lower())
             if norm in {"yes", "y", "true", "1", "found"}:
                 information_found = True
             elif norm in {"no", "n", "false", "0", "notfound"}:
@@ -613,8 +680,8 @@ _builder = StateGraph(
 )
 
 _builder.add_node("prepare_research", prepare_research)
-# Add the compiled subgraph as a node
-_builder.add_node("research_question", research_subgraph)
+# Each Send branch runs the compiled subgraph behind a concurrency gate
+_builder.add_node("research_question", research_question)
 _builder.add_node("finalize_report", finalize_report)
 
 _builder.add_edge(START, "prepare_research")
@@ -8,7 +8,9 @@ This replaces the legacy CSV-based question loading.
 
 from __future__ import annotations
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -70,17 +72,27 @@ def load_subquestions_from_templates(
         # question_loader.py is in .../src/company_researcher/
         questions_dir = Path(__file__).resolve().parent / "prompts" / "questions"
 
+    return list(_load_subquestions(questions_dir))
+
+
+@lru_cache(maxsize=8)
+def _load_subquestions(questions_dir: Path) -> tuple[SubQuestion, ...]:
+    # Templates ship with the package, so read and parse them once per process.
     if not questions_dir.exists():
         raise FileNotFoundError(f"Questions directory not found: {questions_dir}")
 
     qfiles: list[tuple[int, Path]] = []
-    for path in questions_dir.iterdir():
-        if not path.is_file():
-            continue
-        m = _QFILE_RE.match(path.name)
-        if not m:
-            continue
-        qfiles.append((int(m.group("idx")), path))
+    # scandir's DirEntry.is_file() reuses the directory listing's type info
+    # instead of stat()-ing every entry; cheap name checks run first.
+    with os.scandir(questions_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name[:1] not in ("q", "Q") or not name.lower().endswith(".jinja"):
+                continue
+            m = _QFILE_RE.match(name)
+            if not m or not entry.is_file():
+                continue
+            qfiles.append((int(m.group("idx")), Path(entry.path)))
 
     qfiles.sort(key=lambda t: t[0])
     if not qfiles:
@@ -99,5 +111,5 @@ def load_subquestions_from_templates(
             )
         )
 
-    return subquestions
+    return tuple(subquestions)
 
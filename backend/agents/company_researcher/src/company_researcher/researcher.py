@@ -7,40 +7,23 @@ import os
 from pathlib import Path
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 
 from company_researcher.configuration import Configuration
+from company_researcher.search_cache import dedupe_inflight
 from company_researcher.utils import get_api_key_for_model
 
 # Import Tavily tools from shared location
 import sys
-# Add backend/agents to path to import tools
+# Add backend/agents to path to import tools (unless api/main.py or the test
+# setup already did; duplicate entries slow every later import lookup)
 agents_path = Path(__file__).resolve().parents[3]
-sys.path.insert(0, str(agents_path))
-from tools import tavily_search_tool
-
-
-# =============================================================================
-# Prompt Loading
-# =============================================================================
-
-PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
-
-_jinja_env = Environment(
-    loader=FileSystemLoader(str(PROMPTS_DIR)),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-
-
-def load_prompt(template_name: str, **kwargs) -> str:
-    """Load and render a Jinja2 prompt template."""
-    template = _jinja_env.get_template(template_name)
-    return template.render(**kwargs)
+if str(agents_path) not in sys.path:
+    sys.path.insert(0, str(agents_path))
+from tools import get_tavily_api_key, tavily_search_tool
 
 
 # =============================================================================
@@ -71,10 +54,16 @@ async def web_search(queries: List[str], config: RunnableConfig) -> str:
     # Truncate queries to the limit - only process first max_queries queries
     limited_queries = queries[:max_queries]
     
-    return await tavily_search_tool(
-        queries=limited_queries,
-        max_results=cfg.max_search_results,
-        config=config,
+    # Parallel sub-question agents often search the same thing at once.
+    return await dedupe_inflight(
+        limited_queries,
+        cfg.max_search_results,
+        lambda: tavily_search_tool(
+            queries=limited_queries,
+            max_results=cfg.max_search_results,
+            config=config,
+        ),
+        api_key=get_tavily_api_key(config),
     )
 
 
@@ -0,0 +1,50 @@
+"""Share in-flight web searches between parallel sub-question researchers.
+
+Sub-question agents for the same company often issue the same query at about
+the same time. The Redis cache only helps once the first request has finished,
+so identical requests that are still running are joined here instead of being
+sent to Tavily again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import weakref
+from typing import Awaitable, Callable, List, Optional
+
+# Tasks are bound to the loop that created them, so each loop gets its own map.
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _make_key(queries: List[str], max_results: int, api_key: Optional[str]) -> tuple:
+    # Only a digest of the API key is kept; runs with different keys never
+    # share results or each other's failures.
+    key_hash = hashlib.blake2b((api_key or "").encode(), digest_size=8).hexdigest()
+    return (tuple(q.strip().lower() for q in queries), max_results, key_hash)
+
+
+async def dedupe_inflight(
+    queries: List[str],
+    max_results: int,
+    search: Callable[[], Awaitable[str]],
+    api_key: Optional[str] = None,
+) -> str:
+    """Run `search`, or join an identical search that is already in flight."""
+    key = _make_key(queries, max_results, api_key)
+    inflight = _inflight.setdefault(asyncio.get_running_loop(), {})
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(search())
+        inflight[key] = task
+
+        def _release(done: asyncio.Task) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+
+        task.add_done_callback(_release)
+
+    # Shield the shared task so one cancelled caller doesn't cancel the others.
+    return await asyncio.shield(task)
@@ -13,8 +13,11 @@ from langchain_core.tools import tool
 # Add paths to import shared tools and knowledge base
 agents_path = Path(__file__).resolve().parents[3]
 backend_path = Path(__file__).resolve().parents[4]
-sys.path.insert(0, str(agents_path))
-sys.path.insert(0, str(backend_path))
+for _path in (agents_path, backend_path):
+    # Skip entries already present (e.g. added by api/main.py) so sys.path
+    # doesn't accumulate duplicates that every later import has to scan.
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from tools import tavily_search_tool
 
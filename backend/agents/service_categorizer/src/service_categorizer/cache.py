@@ -0,0 +1,52 @@
+"""Redis cache for idempotent service categorizer LLM calls."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+# TTL in seconds (7 days)
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+def _get_redis_client():
+    # Reuse the shared Tavily cache connection when backend/agents is on
+    # sys.path (always the case when running via backend/api).
+    try:
+        from tools.cache import get_redis_client
+    except Exception:  # pragma: no cover - optional dependency/path at runtime
+        return None
+
+    return get_redis_client()
+
+
+def make_response_key(model_name: str, prompt: str) -> str:
+    """Create a deterministic cache key for an exact model + prompt pair."""
+    h = hashlib.blake2b(f"{model_name}|{prompt}".encode(), digest_size=16).hexdigest()
+    return f"categorizer:{h}"
+
+
+def get_cached_response(model_name: str, prompt: str) -> Optional[str]:
+    """Get the cached completion for a prompt if available."""
+    client = _get_redis_client()
+    if not client:
+        return None
+
+    try:
+        data = client.get(make_response_key(model_name, prompt))
+    except Exception:
+        return None
+    # The shared client returns raw bytes.
+    return data.decode() if isinstance(data, bytes) else data
+
+
+def set_cached_response(model_name: str, prompt: str, content: str) -> None:
+    """Cache the completion for a prompt."""
+    client = _get_redis_client()
+    if not client:
+        return
+
+    try:
+        client.setex(make_response_key(model_name, prompt), LLM_CACHE_TTL, content)
+    except Exception:
+        pass
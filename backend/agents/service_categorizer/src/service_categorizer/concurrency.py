@@ -0,0 +1,50 @@
+"""Adaptive concurrency limit for fanning out LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+class AdaptiveSemaphore:
+    """Semaphore whose limit grows on success and halves when throttled.
+
+    Additive increase / multiplicative decrease: after `limit` consecutive
+    successful calls one slot is added (up to `maximum`); a rate-limit or
+    timeout halves the limit (down to `minimum`). Slots already in flight
+    are never revoked; a smaller limit only delays new acquisitions.
+
+    Call record_success/record_throttle while still holding the slot: waiters
+    re-check the limit when it is released.
+    """
+
+    def __init__(self, initial: int, *, minimum: int = 1, maximum: int = 32):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record_success(self) -> None:
+        """Count a successful call; widen the limit after a full window of them."""
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def record_throttle(self) -> None:
+        """Halve the limit after a rate-limit or timeout."""
+        self.limit = max(self.minimum, self.limit // 2)
+        self._successes = 0
+
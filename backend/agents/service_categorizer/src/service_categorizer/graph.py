@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import itertools
+import logging
 import os
 import re
 from pathlib import Path
 
+import openai
+import orjson
 from jinja2 import Environment, FileSystemLoader
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
+from pydantic import TypeAdapter, ValidationError
 
+from service_categorizer.cache import get_cached_response, set_cached_response
+from service_categorizer.concurrency import AdaptiveSemaphore
 from service_categorizer.models import Classification, ObligationAnalysis, ComplianceReport
 from service_categorizer.obligations import get_obligations_for_classification
 from service_categorizer.state import ServiceCategorizerInputState, ServiceCategorizerState
@@ -26,12 +33,22 @@ except Exception:  # pragma: no cover - optional dependency/path at runtime
     _get_dsa_article = None
 
 
+# A numbered point: "\n3. ..." up to the next "\n4. " (or the end).
+_POINT_RE = re.compile(r"(?:^|\n)(\d+)\.\s.*?(?=\n\d+\.\s|\Z)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=128)
+def _article_points(article_text: str) -> dict[str, str]:
+    """Split an article body into its numbered points in a single pass."""
+    points: dict[str, str] = {}
+    for m in _POINT_RE.finditer(article_text):
+        points.setdefault(m.group(1), m.group(0).strip())
+    return points
+
+
 def _extract_article_point(article_text: str, point: str) -> str | None:
     """Best-effort extract of a numbered point (e.g. '3') from an article body."""
-    # Try to match "\n3." ... until next "\n4." (or end)
-    pattern = rf"(?:^|\n){re.escape(point)}\.\s.*?(?=(?:\n\d+\.\s)|\Z)"
-    m = re.search(pattern, article_text, flags=re.DOTALL)
-    return m.group(0).strip() if m else None
+    return _article_points(article_text).get(point)
 
 
 def _get_dsa_legal_text(article_ref: int | str) -> dict[str, str] | None:
@@ -40,10 +57,17 @@ def _get_dsa_legal_text(article_ref: int | str) -> dict[str, str] | None:
 
     Supports article refs like 11 or "24.3" (best-effort extract of point 3).
     """
+    result = _lookup_dsa_legal_text(str(article_ref).strip())
+    # Copy so callers can't mutate the cached entry.
+    return dict(result) if result is not None else None
+
+
+@functools.lru_cache(maxsize=512)
+def _lookup_dsa_legal_text(ref_str: str) -> dict[str, str] | None:
+    # Many obligations share a base article; parse each reference once.
     if _get_dsa_article is None:
         return None
 
-    ref_str = str(article_ref).strip()
     base_num = ref_str.split(".", 1)[0]
     chunk = _get_dsa_article(base_num)
     if chunk is None or not getattr(chunk, "content", None):
@@ -80,27 +104,67 @@ _jinja_env = Environment(
     loader=FileSystemLoader(str(PROMPTS_DIR)),
     trim_blocks=True,
     lstrip_blocks=True,
+    # Prompts ship with the package; skip the per-render mtime check.
+    auto_reload=False,
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _get_template(template_name: str):
+    return _jinja_env.get_template(template_name)
+
+
 def load_prompt(template_name: str, **kwargs) -> str:
     """Load and render a Jinja2 prompt template."""
-    template = _jinja_env.get_template(template_name)
-    return template.render(**kwargs)
+    return _get_template(template_name).render(**kwargs)
 
 
-def _get_model(config: RunnableConfig | None = None) -> ChatOpenAI:
-    """Get configured LLM."""
-    api_key = None
-    base_url = None
-    if config:
-        api_keys = config.get("configurable", {}).get("apiKeys", {})
-        api_key = api_keys.get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
-        base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
-    else:
-        api_key = os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_BASE_URL")
-    
+def _to_json(data) -> str:
+    """Serialise data for prompts and reports (2-space indent, UTF-8)."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+# Obligation analyses in flight at once: the starting limit, and the ceiling
+# the adaptive limiter may grow to while the provider keeps up.
+OBLIGATION_CONCURRENCY = int(os.getenv("OBLIGATION_CONCURRENCY", "4"))
+OBLIGATION_MAX_CONCURRENCY = int(os.getenv("OBLIGATION_MAX_CONCURRENCY", "32"))
+OBLIGATION_MAX_ATTEMPTS = 3
+OBLIGATION_RETRY_BACKOFF = 1.0  # seconds, doubled per attempt
+# Per-call cap so one hung request can't hold the run until the TCP timeout.
+# Hitting it is final: the obligation is reported as failed, not retried.
+OBLIGATION_TIMEOUT = float(os.getenv("OBLIGATION_TIMEOUT", "45"))
+
+# Obligations per LLM call. Above 1, groups share one prompt and the model
+# returns an array; a group whose answer doesn't validate is redone singly.
+OBLIGATION_BATCH_SIZE = max(1, int(os.getenv("OBLIGATION_BATCH_SIZE", "1")))
+_ANALYSES_ADAPTER = TypeAdapter(list[ObligationAnalysis])
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean "slow down" rather than "this request is broken".
+_THROTTLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError)
+
+# Limit learned per API endpoint, carried over to the next run.
+_LEARNED_LIMITS: dict[str | None, int] = {}
+
+# Prompts embed the company profile (and, for obligations and the summary,
+# the analyses), so responses are only cached when explicitly enabled.
+CLASSIFY_CACHE = os.getenv("CLASSIFY_CACHE", "0") == "1"
+OBLIGATION_CACHE = os.getenv("OBLIGATION_CACHE", "0") == "1"
+REPORT_CACHE = os.getenv("REPORT_CACHE", "0") == "1"
+
+
+def _get_credentials(config: RunnableConfig | None = None) -> tuple[str | None, str | None]:
+    """Resolve (api_key, base_url) from config, falling back to the environment."""
+    api_keys = config.get("configurable", {}).get("apiKeys", {}) if config else {}
+    api_key = api_keys.get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
+    base_url = api_keys.get("OPENAI_BASE_URL") or os.getenv("OPENAI_BASE_URL")
+    return api_key, base_url
+
+
+@functools.lru_cache(maxsize=8)
+def _build_model(api_key: str | None, base_url: str | None) -> ChatOpenAI:
+    """Build one client per endpoint so its HTTP connection pool is reused."""
     return ChatOpenAI(
         model="deepseek-reasoner",
         api_key=api_key,
@@ -108,25 +172,96 @@ def _get_model(config: RunnableConfig | None = None) -> ChatOpenAI:
     )
 
 
+def _get_model(config: RunnableConfig | None = None) -> ChatOpenAI:
+    """Get configured LLM."""
+    return _build_model(*_get_credentials(config))
+
+
+def _model_name(model: ChatOpenAI) -> str:
+    return str(getattr(model, "model_name", ""))
+
+
+# A fenced ```json block, else the outermost {...} anywhere in the text.
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"(\{.*\})", re.DOTALL)
+
+
+def _close_truncated_json(text: str) -> str:
+    """Close strings and brackets left open by a response cut off mid-object."""
+    closers: list[str] = []
+    in_string = escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            closers.append("}")
+        elif ch == "[":
+            closers.append("]")
+        elif ch in "}]" and closers:
+            closers.pop()
+
+    if in_string:
+        text += '"'
+    text = text.rstrip().rstrip(",")
+    if text.endswith(":"):
+        text += " null"
+    return text + "".join(reversed(closers))
+
+
+def _parse_json_checked(text: str) -> tuple[dict, bool]:
+    """Extract and parse JSON from text; also report whether it was repaired.
+
+    Repaired output is a partial answer and must not be cached.
+    """
+    m = _FENCED_JSON_RE.search(text) or _JSON_OBJECT_RE.search(text)
+    try:
+        return orjson.loads(m.group(1) if m else text), False
+    except orjson.JSONDecodeError as e:
+        error = e
+
+    # Responses that hit max_tokens stop mid-object; salvage what arrived.
+    start = text.find("{")
+    if start >= 0:
+        try:
+            data = orjson.loads(_close_truncated_json(text[start:]))
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            logger.warning("Recovered truncated JSON response (%d chars); likely hit max_tokens", len(text))
+            return data, True
+    raise error
+
+
 def _parse_json(text: str) -> dict:
     """Extract and parse JSON from text."""
-    # Find JSON block
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        text = text[start:end]
-    elif "```" in text:
-        start = text.find("```") + 3
-        end = text.find("```", start)
-        text = text[start:end]
-    
-    # Find JSON object
-    if "{" in text:
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        text = text[start:end]
-    
-    return json.loads(text)
+    return _parse_json_checked(text)[0]
+
+
+# Fields classify_service bases the obligation set on; a repaired response
+# missing any of them would silently select obligations from defaults.
+_CLASSIFICATION_DECISION_FIELDS = {
+    "territorial_scope": ("is_in_scope",),
+    "service_classification": (
+        "service_category", "is_online_platform", "is_marketplace", "is_search_engine",
+    ),
+    "size_designation": ("is_vlop_vlose", "qualifies_for_sme_exemption"),
+}
+
+
+def _has_decision_fields(classification: dict) -> bool:
+    """Whether a classification carries every field obligation selection reads."""
+    for section, fields in _CLASSIFICATION_DECISION_FIELDS.items():
+        values = classification.get(section)
+        if not isinstance(values, dict) or any(f not in values for f in fields):
+            return False
+    return True
 
 
 # =============================================================================
@@ -137,18 +272,19 @@ async def extract_profile(
     state: ServiceCategorizerState, config: RunnableConfig | None = None
 ) -> dict:
     """Extract company profile from input message."""
-    messages = state.get("messages", [])
-    
-    # Get the last human message as company profile
-    profile_json = "{}"
-    for msg in reversed(messages):
-        if isinstance(msg, HumanMessage):
-            profile_json = msg.content if isinstance(msg.content, str) else str(msg.content)
-            break
+    # Callers that pass the profile directly skip the message scan.
+    profile_json = state.get("company_profile_json")
+    if not profile_json:
+        # Get the last human message as company profile
+        profile_json = "{}"
+        for msg in reversed(state.get("messages", [])):
+            if isinstance(msg, HumanMessage):
+                profile_json = msg.content if isinstance(msg.content, str) else str(msg.content)
+                break
     
     try:
-        profile = json.loads(profile_json)
-    except json.JSONDecodeError:
+        profile = orjson.loads(profile_json)
+    except orjson.JSONDecodeError:
         profile = {"raw_input": profile_json}
     
     # Extract top_domain and summary_long from state
@@ -157,12 +293,32 @@ async def extract_profile(
     
     return {
         "company_profile": profile,
+        "company_profile_json": _to_json(profile),
         "top_domain": top_domain,
         "summary_long": summary_long,
         "messages": [AIMessage(content=f"Analyzing company profile...")]
     }
 
 
+def _warm_downstream() -> None:
+    """Compile the later prompts and parse the DSA text ahead of first use."""
+    for template_name in ("obligation.jinja", "summarize.jinja"):
+        _get_template(template_name)
+    if _get_dsa_article is not None:
+        try:
+            # The first lookup parses the whole DSA document.
+            _get_dsa_article("1")
+        except Exception:
+            # analyze_obligations will surface the error on its own lookup.
+            pass
+
+
+async def warm_up() -> None:
+    """Load templates and the DSA text ahead of the first request."""
+    await asyncio.to_thread(_get_template, "classify.jinja")
+    await asyncio.to_thread(_warm_downstream)
+
+
 async def classify_service(
     state: ServiceCategorizerState, config: RunnableConfig | None = None
 ) -> dict:
@@ -174,16 +330,32 @@ async def classify_service(
     
     prompt = load_prompt(
         "classify.jinja",
-        company_profile=json.dumps(profile, indent=2),
+        company_profile=state.get("company_profile_json") or _to_json(profile),
         top_domain=top_domain,
         summary_long=summary_long,
     )
     
-    response = await model.ainvoke([HumanMessage(content=prompt)])
+    content = None
+    if CLASSIFY_CACHE:
+        # The Redis client is synchronous; keep it off the event loop.
+        content = await asyncio.to_thread(get_cached_response, _model_name(model), prompt)
+    cached = content is not None
+    if not cached:
+        # The event loop is idle while the LLM thinks; load what the next
+        # nodes need in a worker thread meanwhile.
+        response, _ = await asyncio.gather(
+            model.ainvoke([HumanMessage(content=prompt)]),
+            asyncio.to_thread(_warm_downstream),
+        )
+        content = str(response.content)
     
     try:
-        classification = _parse_json(str(response.content))
-    except json.JSONDecodeError:
+        classification, repaired = _parse_json_checked(content)
+        if repaired and not _has_decision_fields(classification):
+            raise ValueError("truncated classification is missing decision fields")
+        if CLASSIFY_CACHE and not cached and not repaired:
+            await asyncio.to_thread(set_cached_response, _model_name(model), prompt, content)
+    except (orjson.JSONDecodeError, ValueError):
         classification = {
             "territorial_scope": {"is_in_scope": False, "reasoning": "Parse error"},
             "service_classification": {
@@ -194,7 +366,7 @@ async def classify_service(
                 "is_search_engine": False,
             },
             "size_designation": {"is_vlop_vlose": False},
-            "summary": str(response.content)[:500]
+            "summary": content[:500]
         }
     
     # Get applicable obligations based on classification
@@ -225,11 +397,59 @@ async def classify_service(
     
     return {
         "classification": classification,
+        "classification_json": _to_json(classification),
         "obligations": obligations,
         "messages": [AIMessage(content=f"Classification complete. Found {len(obligations)} applicable obligations.")]
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _render_obligation_prompt(
+    obligation_json: str,
+    profile_json: str,
+    company_name: str,
+    classification_summary: str,
+    summary_long: str | None,
+) -> str:
+    """Render obligation.jinja; re-runs for the same company reuse the string."""
+    obligation = orjson.loads(obligation_json)
+    # Obligations come with context and key_requirements from YAML.
+    # Additionally, fetch the official DSA legal text from knowledge_base/dsa.html.
+    legal_text = _get_dsa_legal_text(obligation.get("article", ""))
+    return load_prompt(
+        "obligation.jinja",
+        company_profile=profile_json,
+        company_name=company_name,
+        obligation=obligation,
+        classification_summary=classification_summary,
+        summary_long=summary_long,
+        dsa_legal_text=legal_text,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _render_obligation_batch_prompt(
+    obligations_json: str,
+    profile_json: str,
+    company_name: str,
+    classification_summary: str,
+    summary_long: str | None,
+) -> str:
+    """Render obligation_batch.jinja for a group of obligations."""
+    items = [
+        {"obligation": obl, "dsa_legal_text": _get_dsa_legal_text(obl.get("article", ""))}
+        for obl in orjson.loads(obligations_json)
+    ]
+    return load_prompt(
+        "obligation_batch.jinja",
+        company_profile=profile_json,
+        company_name=company_name,
+        items=items,
+        classification_summary=classification_summary,
+        summary_long=summary_long,
+    )
+
+
 async def analyze_obligations(
     state: ServiceCategorizerState, config: RunnableConfig | None = None
 ) -> dict:
@@ -242,43 +462,135 @@ async def analyze_obligations(
     if not obligations:
         return {"obligation_analyses": [], "messages": [AIMessage(content="No obligations to analyze.")]}
     
+    # A no-op after classify_service's warm-up; when classify was served from
+    # cache it keeps the one-off DSA document parse off the event loop.
+    await asyncio.to_thread(_warm_downstream)
+
     model = _get_model(config)
     company_name = profile.get("company_name", "Unknown Company")
     classification_summary = classification.get("summary", "")
+    # Identical for every obligation; serialised once by extract_profile.
+    profile_json = state.get("company_profile_json") or _to_json(profile)
     
+    # One pool of slots for the whole run: a new call starts as soon as any
+    # in-flight one returns, instead of each batch waiting on its slowest call.
+    # The pool widens while calls succeed and halves when the API throttles.
+    _, base_url = _get_credentials(config)
+    limiter = AdaptiveSemaphore(
+        _LEARNED_LIMITS.get(base_url, OBLIGATION_CONCURRENCY),
+        maximum=OBLIGATION_MAX_CONCURRENCY,
+    )
+
+    prompt_context = (profile_json, str(company_name), str(classification_summary), summary_long)
+
+    async def invoke(prompt: str) -> str:
+        """Call the model with throttle-aware retries; raises after the last attempt."""
+        for attempt in range(OBLIGATION_MAX_ATTEMPTS):
+            async with limiter:
+                try:
+                    response = await asyncio.wait_for(
+                        model.ainvoke([HumanMessage(content=prompt)]),
+                        timeout=OBLIGATION_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    # The full budget is spent; retrying would multiply the tail.
+                    limiter.record_throttle()
+                    raise
+                except _THROTTLE_ERRORS:
+                    limiter.record_throttle()
+                    if attempt == OBLIGATION_MAX_ATTEMPTS - 1:
+                        raise
+                else:
+                    limiter.record_success()
+                    return str(response.content)
+            await asyncio.sleep(OBLIGATION_RETRY_BACKOFF * 2 ** attempt)
+
     async def analyze_one(obl: dict) -> dict:
-        # Obligations come with context and key_requirements from YAML.
-        # Additionally, fetch the official DSA legal text from knowledge_base/dsa.html.
-        legal_text = _get_dsa_legal_text(obl.get("article", ""))
-        prompt = load_prompt(
-            "obligation.jinja",
-            company_profile=json.dumps(profile, indent=2),
-            company_name=company_name,
-            obligation=obl,
-            classification_summary=classification_summary,
-            summary_long=summary_long,
-            dsa_legal_text=legal_text,
+        prompt = _render_obligation_prompt(
+            orjson.dumps(obl, option=orjson.OPT_SORT_KEYS).decode(), *prompt_context
         )
         
+        if OBLIGATION_CACHE:
+            content = await asyncio.to_thread(get_cached_response, _model_name(model), prompt)
+            if content is not None:
+                try:
+                    return _parse_json(content)
+                except orjson.JSONDecodeError:
+                    pass
+
+        try:
+            content = await invoke(prompt)
+            analysis, repaired = _parse_json_checked(content)
+            if repaired:
+                # Only a complete analysis is worth more than the failure entry
+                ObligationAnalysis.model_validate(analysis)
+            if OBLIGATION_CACHE and not repaired:
+                await asyncio.to_thread(set_cached_response, _model_name(model), prompt, content)
+            return analysis
+        except Exception as e:
+            return failed_analysis(obl, e)
+
+    def failed_analysis(obl: dict, e: BaseException) -> dict:
+        return {
+            "article": str(obl.get("article", "?")),
+            "title": obl.get("title", "Unknown"),
+            "applies": True,
+            "implications": f"Analysis failed: {(str(e) or type(e).__name__)[:50]}",
+            "action_items": ["Review this article manually"],
+        }
+
+    async def analyze_group(group: list[dict]) -> list[dict]:
+        if len(group) == 1:
+            return [await analyze_one(group[0])]
+
+        prompt = _render_obligation_batch_prompt(
+            orjson.dumps(group, option=orjson.OPT_SORT_KEYS).decode(), *prompt_context
+        )
+        cached = (
+            await asyncio.to_thread(get_cached_response, _model_name(model), prompt)
+            if OBLIGATION_CACHE
+            else None
+        )
         try:
-            response = await model.ainvoke([HumanMessage(content=prompt)])
-            return _parse_json(str(response.content))
+            content = cached if cached is not None else await invoke(prompt)
         except Exception as e:
-            return {
-                "article": str(obl.get("article", "?")),
-                "title": obl.get("title", "Unknown"),
-                "applies": True,
-                "implications": f"Analysis failed: {str(e)[:50]}",
-                "action_items": ["Review this article manually"],
-            }
+            # Throttled past its retries or timed out: splitting the batch
+            # would only fire more calls into the same limit.
+            return [failed_analysis(o, e) for o in group]
+        try:
+            parsed, repaired = _parse_json_checked(content)
+            analyses = parsed.get("analyses") if isinstance(parsed, dict) else None
+            # Catches truncated or mis-shaped arrays before they reach the report
+            _ANALYSES_ADAPTER.validate_python(analyses)
+            # Every obligation answered exactly once; a repeated entry must not
+            # stand in for one the model skipped.
+            by_key = {(str(a["article"]), a["title"]): a for a in analyses}
+            keys = [(str(o.get("article", "")), o.get("title")) for o in group]
+            if len(by_key) != len(analyses) or set(by_key) != set(keys):
+                raise ValueError(f"analyses do not match the {len(group)} obligations asked")
+            analyses = [by_key[key] for key in keys]
+        except (orjson.JSONDecodeError, ValidationError, ValueError):
+            return list(await asyncio.gather(*[analyze_one(o) for o in group]))
+        if OBLIGATION_CACHE and cached is None and not repaired:
+            await asyncio.to_thread(set_cached_response, _model_name(model), prompt, content)
+        return analyses
     
-    # Process in parallel (batches of 5)
-    analyses = []
-    batch_size = 5
-    for i in range(0, len(obligations), batch_size):
-        batch = obligations[i:i + batch_size]
-        batch_results = await asyncio.gather(*[analyze_one(o) for o in batch])
-        analyses.extend(batch_results)
+    # Identical obligations would render identical prompts; analyse each once.
+    unique: dict[tuple[str, str | None], dict] = {}
+    for o in obligations:
+        unique.setdefault((str(o.get("article", "")), o.get("title")), o)
+
+    pending = list(unique.values())
+    groups = [
+        pending[i:i + OBLIGATION_BATCH_SIZE]
+        for i in range(0, len(pending), OBLIGATION_BATCH_SIZE)
+    ]
+
+    # Process in parallel; gather keeps the results in obligation order
+    grouped = await asyncio.gather(*[analyze_group(g) for g in groups])
+    results = dict(zip(unique, itertools.chain.from_iterable(grouped)))
+    analyses = [results[(str(o.get("article", "")), o.get("title"))] for o in obligations]
+    _LEARNED_LIMITS[base_url] = limiter.limit
     
     return {
         "obligation_analyses": analyses,
@@ -300,12 +612,24 @@ async def generate_report(
     prompt = load_prompt(
         "summarize.jinja",
         company_name=company_name,
-        classification=json.dumps(classification, indent=2),
+        classification=state.get("classification_json") or _to_json(classification),
         obligation_analyses=analyses,
     )
     
-    response = await model.ainvoke([HumanMessage(content=prompt)])
-    summary = str(response.content)
+    summary = (
+        await asyncio.to_thread(get_cached_response, _model_name(model), prompt)
+        if REPORT_CACHE
+        else None
+    )
+    if summary is None:
+        # Stream so the summary reaches astream_events consumers token by
+        # token (on_chat_model_stream) instead of after the full completion.
+        parts = []
+        async for chunk in model.astream([HumanMessage(content=prompt)]):
+            parts.append(str(chunk.content))
+        summary = "".join(parts)
+        if REPORT_CACHE and summary.strip():
+            await asyncio.to_thread(set_cached_response, _model_name(model), prompt, summary)
     
     # Build final report
     report = {
@@ -315,9 +639,11 @@ async def generate_report(
         "summary": summary,
     }
     
-    final_json = json.dumps(report, indent=2)
+    # Serialised once: the same string backs final_report and the message.
+    final_json = _to_json(report)
     
     return {
+        "report": report,
         "final_report": final_json,
         "messages": [AIMessage(content=final_json)]
     }
@@ -343,6 +669,7 @@ _builder.add_edge("classify_service", "analyze_obligations")
 _builder.add_edge("analyze_obligations", "generate_report")
 _builder.add_edge("generate_report", END)
 
-# Export compiled graph
+# Export compiled graph. No checkpointer: runs are one-shot, so nothing is
+# persisted between nodes.
 service_categorizer = _builder.compile()
 
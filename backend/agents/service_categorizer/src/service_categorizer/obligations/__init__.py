@@ -1,5 +1,7 @@
 """DSA obligation loader - loads from consolidated obligations YAML file."""
 
+import threading
+from itertools import product
 from pathlib import Path
 from typing import Any
 
@@ -9,19 +11,54 @@ import yaml
 OBLIGATIONS_DIR = Path(__file__).resolve().parent
 OBLIGATIONS_FILE = OBLIGATIONS_DIR / "obligations.yaml"
 
+# libyaml's C loader when available; same safe semantics, much faster parse.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Cache loaded obligations
 _cache: dict[str, Any] | None = None
+_load_lock = threading.Lock()
+_by_article: dict[str, dict[str, Any]] = {}
+
+# (service_category, 5 classification flags) -> selected obligations. Every
+# combination is computed at load time, so a lookup is a single dict get.
+_ClassificationKey = tuple[str, bool, bool, bool, bool, bool]
+_precomputed: dict[_ClassificationKey, tuple[dict[str, Any], ...]] = {}
+
+# We support multiple SME rules so Online Platforms vs Online Marketplaces can differ.
+_SME_RULE_KEYS = ("sme_exemption_online_platform", "sme_exemption_online_marketplace")
+# service_category -> SME rules whose applicable_categories include it.
+_sme_rules_by_category: dict[str, tuple[dict[str, Any], ...]] = {}
 
 
 def _load_obligations() -> dict[str, Any]:
     """Load and cache the consolidated obligations YAML file."""
     global _cache
     if _cache is None:
-        with open(OBLIGATIONS_FILE, "r", encoding="utf-8") as f:
-            _cache = yaml.safe_load(f)
+        # Threads in the API worker pool may race here; parse the file once.
+        with _load_lock:
+            if _cache is None:
+                _cache = _parse_obligations()
     return _cache
 
 
+def _parse_obligations() -> dict[str, Any]:
+    with open(OBLIGATIONS_FILE, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    # Build lookup by article number (supports both int and str like "24.3")
+    _by_article.clear()
+    for obl in data.get("obligations", []):
+        if isinstance(obl, dict) and "article" in obl:
+            _by_article[str(obl["article"])] = obl
+
+    _freeze_size_rules(data.get("size_rules", {}) or {})
+
+    _precomputed.clear()
+    for category in data.get("category_articles", {}) or {}:
+        for flags in product((False, True), repeat=5):
+            _precomputed[(category, *flags)] = _select_obligations(data, category, *flags)
+    return data
+
+
 def get_obligations_for_classification(
     service_category: str,
     is_online_platform: bool,
@@ -44,74 +81,88 @@ def get_obligations_for_classification(
     Returns:
         List of obligations with full context from YAML file.
     """
-    data = _load_obligations()
-    all_obligations = data.get("obligations", [])
-
-    # Build lookup by article number (supports both int and str like "24.3")
-    obligation_by_article: dict[str, dict[str, Any]] = {}
-    for obl in all_obligations:
-        if "article" in obl:
-            obligation_by_article[str(obl["article"])] = obl
-
+    _load_obligations()
+    key = (
+        service_category,
+        bool(is_online_platform),
+        bool(is_marketplace),
+        bool(is_search_engine),
+        bool(is_vlop_vlose),
+        bool(is_sme_exemption_eligible),
+    )
+    # Categories without an article list select nothing.
+    return list(_precomputed.get(key, ()))
+
+
+def _freeze_size_rules(size_rules: dict[str, Any]) -> None:
+    """Normalise the rule lists once into frozensets used for membership tests."""
+    for rule in size_rules.values():
+        if not isinstance(rule, dict):
+            continue
+        rule["applicable_categories"] = frozenset(rule.get("applicable_categories", []) or [])
+        rule["exempt_articles"] = frozenset(rule.get("exempt_articles", []) or [])
+        # Articles that are NOT exempt even if in exempt_articles (e.g., "24.3").
+        # Compared as strings, so YAML ints and strings both match.
+        rule["not_exempt_articles"] = frozenset(map(str, rule.get("not_exempt_articles", []) or []))
+
+    # Index SME rules by category so selection only visits rules that can apply.
+    _sme_rules_by_category.clear()
+    for rule_key in _SME_RULE_KEYS:
+        sme_rule = size_rules.get(rule_key)
+        if not isinstance(sme_rule, dict) or not sme_rule["exempt_articles"]:
+            continue
+        for category in sme_rule["applicable_categories"]:
+            _sme_rules_by_category[category] = (*_sme_rules_by_category.get(category, ()), sme_rule)
+
+
+def _select_obligations(
+    data: dict[str, Any],
+    service_category: str,
+    is_online_platform: bool,
+    is_marketplace: bool,
+    is_search_engine: bool,
+    is_vlop_vlose: bool,
+    is_sme_exemption_eligible: bool,
+) -> tuple[dict[str, Any], ...]:
+    """Select the obligations for one classification (run once per key at load)."""
     category_articles: dict[str, list[int | str]] = data.get("category_articles", {}) or {}
     size_rules: dict[str, Any] = data.get("size_rules", {}) or {}
 
     base_articles = category_articles.get(service_category, [])
     if not base_articles:
-        return []
+        return ()
 
     # Start from base list for the category (can contain int or str like "24.3")
     selected_articles: list[int | str] = list(base_articles)
 
     # VLOP/VLOSE adds extra obligations (does not replace base)
     vlop_rule: dict[str, Any] = size_rules.get("vlop_vlose", {}) or {}
-    if is_vlop_vlose and service_category in (vlop_rule.get("applicable_categories", []) or []):
+    if is_vlop_vlose and service_category in vlop_rule.get("applicable_categories", ()):
         selected_articles.extend(vlop_rule.get("extra_articles", []) or [])
 
     # SME exemption removes certain obligations (rule depends on category).
-    # We support multiple SME rules so Online Platforms vs Online Marketplaces can differ.
     if is_sme_exemption_eligible:
-        for rule_key in ("sme_exemption_online_platform", "sme_exemption_online_marketplace"):
-            sme_rule: dict[str, Any] = size_rules.get(rule_key, {}) or {}
-            if not sme_rule:
-                continue
-
-            if service_category not in (sme_rule.get("applicable_categories", []) or []):
-                continue
-
+        for sme_rule in _sme_rules_by_category.get(service_category, ()):
             if sme_rule.get("not_if_marketplace", False) and is_marketplace:
                 continue
 
             if sme_rule.get("not_if_vlop_vlose", False) and is_vlop_vlose:
                 continue
 
-            exempt_articles = set(sme_rule.get("exempt_articles", []) or [])
-            # Articles that are NOT exempt even if in exempt_articles (e.g., "24.3")
-            not_exempt_articles = set(sme_rule.get("not_exempt_articles", []) or [])
-            
-            if exempt_articles:
-                # Remove exempt articles, but keep not_exempt_articles even if they're in exempt_articles
-                selected_articles = [
-                    a for a in selected_articles 
-                    if a not in exempt_articles or str(a) in not_exempt_articles
-                ]
+            exempt_articles = sme_rule["exempt_articles"]
+            not_exempt_articles = sme_rule["not_exempt_articles"]
+            # Remove exempt articles, but keep not_exempt_articles even if they're in exempt_articles
+            selected_articles = [
+                a for a in selected_articles 
+                if a not in exempt_articles or str(a) in not_exempt_articles
+            ]
 
     # De-duplicate while preserving order (handle both int and str article numbers)
-    seen: set[int | str] = set()
-    ordered_unique_articles: list[int | str] = []
-    for a in selected_articles:
-        if a not in seen:
-            seen.add(a)
-            ordered_unique_articles.append(a)
-
-    # Materialize obligation objects (skip if missing from YAML list)
-    result: list[dict[str, Any]] = []
-    for a in ordered_unique_articles:
-        obl = obligation_by_article.get(str(a))
-        if obl is not None:
-            result.append(obl)
-
-    return result
+    # and materialize obligation objects (skip if missing from YAML list)
+    return tuple(
+        obl for a in dict.fromkeys(selected_articles)
+        if (obl := _by_article.get(str(a))) is not None
+    )
 
 
 def get_all_obligations() -> list[dict[str, Any]]:
@@ -122,8 +173,9 @@ def get_all_obligations() -> list[dict[str, Any]]:
 
 def get_obligation_by_article(article: int | str) -> dict[str, Any] | None:
     """Get a specific obligation by article number."""
-    obligations = get_all_obligations()
-    for obl in obligations:
-        if str(obl.get("article", "")) == str(article):
-            return obl
-    return None
+    _load_obligations()
+    return _by_article.get(str(article))
+
+
+# Load eagerly so the first classification doesn't pay for the YAML parse.
+_load_obligations()
@@ -10,16 +10,20 @@ class ServiceCategorizerInputState(TypedDict):
     messages: Annotated[list[AnyMessage], add_messages]
     top_domain: str | None  # Optional top domain
     summary_long: str | None  # Optional long summary
+    company_profile_json: str | None  # Optional profile JSON; skips the message scan
 
 
 class ServiceCategorizerState(TypedDict):
     """Full internal state."""
     messages: Annotated[list[AnyMessage], add_messages]
     company_profile: dict[str, Any]  # The company profile from research
+    company_profile_json: str        # company_profile serialised once for prompts
     top_domain: str | None  # Optional top domain
     summary_long: str | None  # Optional long summary
     classification: dict[str, Any]   # Result of classification step
+    classification_json: str         # classification serialised once for prompts
     obligations: list[dict]          # List of applicable obligations
     obligation_analyses: list[dict]  # Analysis of each obligation
-    final_report: str                # Final summarized report
+    report: dict[str, Any]           # Final report as structured data
+    final_report: str                # Final summarized report (JSON of `report`)
 
@@ -1,18 +1,66 @@
 """Redis cache for Tavily search results."""
 
 import hashlib
-import json
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
 
+import orjson
 import redis
 
 # TTL in seconds (6 hours)
 CACHE_TTL = 6 * 60 * 60
 
+# In-process entries kept in front of Redis
+LOCAL_CACHE_SIZE = int(os.getenv("TAVILY_LOCAL_CACHE_SIZE", "1024"))
+
 _client: Optional[redis.Redis] = None
 
 
+class _LocalCache:
+    """Small thread-safe LRU with per-entry expiry.
+
+    Repeat lookups in the same process skip the Redis round-trip and JSON
+    decode. Stored responses are shared, so callers must not mutate them.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalCache(LOCAL_CACHE_SIZE, CACHE_TTL)
+
+
 def get_redis_client() -> Optional[redis.Redis]:
     """Get Redis client, connecting lazily."""
     global _client
@@ -24,7 +72,8 @@ def get_redis_client() -> Optional[redis.Redis]:
         return None
 
     try:
-        _client = redis.from_url(redis_url, decode_responses=True)
+        # Values are stored as orjson bytes; skip the str round-trip.
+        _client = redis.from_url(redis_url, decode_responses=False)
         _client.ping()
         return _client
     except Exception:
@@ -35,20 +84,27 @@ def get_redis_client() -> Optional[redis.Redis]:
 def make_cache_key(query: str, max_results: int) -> str:
     """Create a deterministic cache key."""
     normalized = query.strip().lower()
-    h = hashlib.sha256(f"{normalized}:{max_results}".encode()).hexdigest()[:16]
+    h = hashlib.blake2b(f"{normalized}:{max_results}".encode(), digest_size=8).hexdigest()
     return f"tavily:{h}"
 
 
 def get_cached(query: str, max_results: int) -> Optional[dict]:
     """Get cached Tavily response if available."""
+    key = make_cache_key(query, max_results)
+    response = _local.get(key)
+    if response is not None:
+        return response
+
     client = get_redis_client()
     if not client:
         return None
 
     try:
-        data = client.get(make_cache_key(query, max_results))
+        data = client.get(key)
         if data:
-            return json.loads(data)
+            response = orjson.loads(data)
+            _local.set(key, response)
+            return response
     except Exception:
         # Redis can be restarted while the app is running; drop the client so we reconnect next call.
         global _client
@@ -56,20 +112,63 @@ def get_cached(query: str, max_results: int) -> Optional[dict]:
     return None
 
 
+def get_cached_many(queries: Sequence[str], max_results: int) -> List[Optional[dict]]:
+    """Get cached Tavily responses for several queries in one MGET round-trip."""
+    keys = [make_cache_key(q, max_results) for q in queries]
+    results: List[Optional[dict]] = [_local.get(key) for key in keys]
+    missing = [i for i, response in enumerate(results) if response is None]
+    client = get_redis_client()
+    if not client or not missing:
+        return results
+
+    try:
+        values = client.mget([keys[i] for i in missing])
+    except Exception:
+        global _client
+        _client = None
+        return results
+
+    for i, data in zip(missing, values):
+        if data:
+            try:
+                results[i] = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                continue
+            _local.set(keys[i], results[i])
+    return results
+
+
 def set_cached(query: str, max_results: int, response: dict) -> None:
     """Cache a Tavily response."""
+    key = make_cache_key(query, max_results)
+    _local.set(key, response)
+
     client = get_redis_client()
     if not client:
         return
 
     try:
-        key = make_cache_key(query, max_results)
-        client.setex(key, CACHE_TTL, json.dumps(response))
+        client.setex(key, CACHE_TTL, orjson.dumps(response))
     except Exception:
         global _client
         _client = None
 
 
+def set_cached_many(responses: Sequence[Tuple[str, dict]], max_results: int) -> None:
+    """Cache several Tavily responses in one pipelined round-trip."""
+    keyed = [(make_cache_key(q, max_results), response) for q, response in responses]
+    for key, response in keyed:
+        _local.set(key, response)
 
+    client = get_redis_client()
+    if not client or not keyed:
+        return
 
-
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, response in keyed:
+            pipe.setex(key, CACHE_TTL, orjson.dumps(response))
+        pipe.execute()
+    except Exception:
+        global _client
+        _client = None
@@ -1,10 +1,62 @@
 """Tavily search tools for agents."""
 
+import asyncio
 import os
+import weakref
 from typing import List, Optional
 
+import httpx
 from langchain_core.runnables import RunnableConfig
 from tavily import AsyncTavilyClient
+from tavily.errors import TimeoutError as TavilyTimeoutError, UsageLimitExceededError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from .cache import get_cached_many, set_cached_many
+
+# Process-wide cap on in-flight Tavily requests. Parallel agents stay at the
+# provider's rate budget instead of bursting into 429s.
+TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "8"))
+
+# asyncio primitives are bound to the loop that first waits on them, so the
+# cap is kept per running loop (tests and warm-up paths run their own).
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Rate limits, timeouts and transient HTTP failures are worth another attempt;
+# bad requests and key errors are not.
+_RETRYABLE_ERRORS = (
+    UsageLimitExceededError,
+    TavilyTimeoutError,
+    httpx.TransportError,
+)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # The SDK raises HTTPStatusError for every status it doesn't map itself,
+    # 4xx included; only server errors and request timeouts are transient.
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 408
+    return isinstance(exc, _RETRYABLE_ERRORS)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the request cap for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(TAVILY_MAX_CONCURRENCY)
+    return semaphore
+
+# One client per API key so searches reuse its HTTP connection pool instead
+# of paying a TCP + TLS handshake on every call.
+_clients: dict[str, AsyncTavilyClient] = {}
 
 
 def get_tavily_api_key(config: Optional[RunnableConfig] = None) -> Optional[str]:
@@ -19,6 +71,42 @@ def get_tavily_api_key(config: Optional[RunnableConfig] = None) -> Optional[str]
     return os.getenv("TAVILY_API_KEY")
 
 
+def _get_client(api_key: str) -> AsyncTavilyClient:
+    """Return the shared client for an API key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncTavilyClient(api_key=api_key)
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared Tavily clients. Call on application shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+@retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(min=0.5, max=8),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+async def _search(client: AsyncTavilyClient, query: str, max_results: int) -> dict:
+    """Run one Tavily search, retrying transient failures with jittered backoff."""
+    # Backoff sleeps happen outside the semaphore so they don't hold a slot.
+    async with _get_semaphore():
+        return await client.search(
+            query,
+            max_results=max_results,
+            include_raw_content=False,
+        )
+
+
 async def tavily_search_tool(
     queries: List[str],
     max_results: int = 3,
@@ -32,46 +120,52 @@ async def tavily_search_tool(
     if not api_key:
         return "Error: TAVILY_API_KEY not configured."
     
-    client = AsyncTavilyClient(api_key=api_key)
+    client = _get_client(api_key)
     
+    # Repeated queries (across agent iterations or runs) are served from cache;
+    # the rest are searched concurrently.
+    responses: List[object] = get_cached_many(queries, max_results)
+    missed = [i for i, response in enumerate(responses) if response is None]
+    fetched = await asyncio.gather(
+        *(_search(client, queries[i], max_results) for i in missed),
+        return_exceptions=True,
+    )
+    for i, response in zip(missed, fetched):
+        responses[i] = response
+    set_cached_many(
+        [(queries[i], r) for i, r in zip(missed, fetched) if not isinstance(r, BaseException)],
+        max_results,
+    )
+
     all_results = []
     seen_urls = set()
     
-    for query in queries:
-        try:
-            # Perform Tavily search directly
-            response = await client.search(
-                query,
-                max_results=max_results,
-                include_raw_content=False,
-            )
-
-            for result in response.get("results", []):
-                url = result.get("url", "")
-                # Deduplicate by URL
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append({
-                        "title": result.get("title", ""),
-                        "url": url,
-                        "content": result.get("content", ""),
-                    })
-        except Exception as e:
-            all_results.append({"error": f"Search failed for '{query}': {str(e)[:80]}"})
+    for query, response in zip(queries, responses):
+        if isinstance(response, BaseException):
+            all_results.append({"error": f"Search failed for '{query}': {str(response)[:80]}"})
+            continue
+
+        for result in response.get("results", []):
+            url = result.get("url", "")
+            # Deduplicate by URL
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                all_results.append({
+                    "title": result.get("title", ""),
+                    "url": url,
+                    "content": result.get("content", ""),
+                })
     
     if not all_results:
         return "No search results found. Try different search queries."
     
     # Format results compactly
-    formatted = "Search Results:\n\n"
+    parts = ["Search Results:\n\n"]
     # Include at most 10 aggregated results to avoid huge contexts
     for i, result in enumerate(all_results[:10], 1):
         if "error" in result:
-            formatted += f"{i}. {result['error']}\n\n"
+            parts.append(f"{i}. {result['error']}\n\n")
         else:
-            formatted += f"{i}. **{result['title']}**\n"
-            formatted += f"   {result['url']}\n"
-            formatted += f"   {result['content']}\n\n"
+            parts.append(f"{i}. **{result['title']}**\n   {result['url']}\n   {result['content']}\n\n")
     
-    return formatted
-
+    return "".join(parts)
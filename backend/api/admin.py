@@ -1,15 +1,27 @@
 """Admin API endpoints for session monitoring and analytics."""
 
+import asyncio
+import base64
+import functools
+import hashlib
+import heapq
 import io
 import os
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+import anyio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy import and_, case, desc, func, or_
+from sqlalchemy.orm import Session as DBSession, load_only, raiseload, selectinload
 
 from database import ChatMessage, Session, SessionStep, get_db
 from database.models import SessionStatus
@@ -44,24 +56,151 @@ def verify_admin(credentials: HTTPBasicCredentials = Depends(security)) -> str:
 # Router
 # =============================================================================
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+class _ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Stats and session lists are large dicts of strings and numbers; orjson
+    encodes them several times faster than the stdlib encoder. (FastAPI's own
+    ORJSONResponse is deprecated in favour of response models.)
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], default_response_class=_ORJSONResponse)
+
+# Handlers are async and run their ORM work on this worker budget, matching
+# the engine's pool_size, so admin requests waiting for a connection queue on the
+# event loop instead of parking threads in the shared threadpool. There is no
+# async driver in the deployment (psycopg2 only), hence threads at all.
+DB_CONCURRENCY = int(os.getenv("ADMIN_DB_CONCURRENCY", "5"))
+_db_limiter = anyio.CapacityLimiter(DB_CONCURRENCY)
+
+
+async def _run_db(fn, *args):
+    """Run blocking ORM work off the event loop on the admin DB budget."""
+    return await anyio.to_thread.run_sync(fn, *args, limiter=_db_limiter)
 
 
 # =============================================================================
 # Dashboard Stats
 # =============================================================================
 
+# The dashboard polls these aggregates; serve repeat requests for the same
+# window from memory for a short while instead of rescanning the table.
+# Sessions created or updated by the assessment API (api/main.py) do not
+# invalidate this cache; they show up once the TTL expires. Only the admin
+# delete endpoints invalidate, so an admin sees their own deletions at once.
+STATS_CACHE_TTL = float(os.getenv("ADMIN_STATS_CACHE_TTL", "30"))
+
+_stats_cache: dict[int, tuple[float, dict]] = {}
+# Guards _stats_cache only; never held while the aggregates are computed.
+_stats_lock = threading.Lock()
+# One compute per window at a time; concurrent misses await the same task.
+_stats_inflight: dict[int, asyncio.Task] = {}
+# Bumped by _invalidate_stats; a compute that started earlier must not store.
+# This guards against racing admin deletions only (see above).
+_stats_generation = 0
+
+
+def _invalidate_stats() -> None:
+    """Drop cached dashboard stats after admin deletions.
+
+    Called only from the admin delete endpoints. Session writes from the
+    assessment flow rely on STATS_CACHE_TTL instead, since invalidating on
+    every step would defeat the cache under load.
+    """
+    global _stats_generation
+    with _stats_lock:
+        _stats_generation += 1
+        _stats_cache.clear()
+    # Later requests must not join a compute that may predate the deletion.
+    _stats_inflight.clear()
+
+
 @router.get("/stats")
-def get_dashboard_stats(
+async def get_dashboard_stats(
+    response: Response,
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
     days: int = Query(default=7, ge=1, le=90),
 ):
     """Get dashboard statistics for the last N days."""
+    response.headers["Cache-Control"] = f"private, max-age={int(STATS_CACHE_TTL)}"
+    return await _get_cached_dashboard_stats(db, days)
+
+
+async def _get_cached_dashboard_stats(db: DBSession, days: int) -> dict:
+    with _stats_lock:
+        cached = _stats_cache.get(days)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Waiters await on the event loop rather than each holding a DB worker
+    # slot, and a slow window never blocks other windows or invalidation.
+    task = _stats_inflight.get(days)
+    if task is None:
+        # The task may outlive this request (shielded for other waiters), so
+        # it opens its own session rather than borrowing the request's one.
+        task = asyncio.ensure_future(_refresh_stats(db.get_bind(), days))
+        _stats_inflight[days] = task
+
+        def _release(done: asyncio.Task) -> None:
+            if _stats_inflight.get(days) is done:
+                del _stats_inflight[days]
+
+        task.add_done_callback(_release)
+
+    # Shield the shared task so one cancelled caller doesn't cancel the others.
+    return await asyncio.shield(task)
+
+
+async def _refresh_stats(bind, days: int) -> dict:
+    with _stats_lock:
+        generation = _stats_generation
+    stats = await _run_db(_compute_dashboard_stats_in_own_session, bind, days)
+    with _stats_lock:
+        if generation == _stats_generation:
+            _stats_cache[days] = (time.monotonic() + STATS_CACHE_TTL, stats)
+    return stats
+
+
+def _compute_dashboard_stats_in_own_session(bind, days: int) -> dict:
+    with DBSession(bind=bind) as db:
+        return _compute_dashboard_stats(db, days)
+
+
+def _compute_dashboard_stats(db: DBSession, days: int) -> dict:
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     
-    # Total sessions
-    total_sessions = db.query(Session).filter(Session.created_at >= cutoff).count()
+    # Scalar aggregates in a single pass over the window
+    (
+        total_sessions,
+        avg_duration,
+        total_llm_calls,
+        total_search_calls,
+        total_cost,
+    ) = (
+        db.query(
+            func.count(Session.id),
+            # Average duration for completed sessions
+            func.avg(
+                case(
+                    (Session.status == SessionStatus.COMPLETED, Session.total_duration_seconds),
+                )
+            ),
+            func.sum(Session.total_llm_calls),
+            func.sum(Session.total_search_calls),
+            func.sum(Session.estimated_cost_usd),
+        )
+        .filter(Session.created_at >= cutoff)
+        .one()
+    )
+    avg_duration = avg_duration or 0
+    total_llm_calls = total_llm_calls or 0
+    total_search_calls = total_search_calls or 0
+    total_cost = total_cost or 0
     
     # Sessions by status
     status_counts = dict(
@@ -78,51 +217,29 @@ def get_dashboard_stats(
     errors = status_counts.get(SessionStatus.ERROR, 0)
     error_rate = (errors / total_sessions * 100) if total_sessions > 0 else 0
     
-    # Average duration for completed sessions
-    avg_duration_result = (
-        db.query(func.avg(Session.total_duration_seconds))
-        .filter(Session.created_at >= cutoff)
-        .filter(Session.status == SessionStatus.COMPLETED)
-        .scalar()
-    )
-    avg_duration = avg_duration_result or 0
-    
-    # Total API calls
-    total_llm_calls = (
-        db.query(func.sum(Session.total_llm_calls))
-        .filter(Session.created_at >= cutoff)
-        .scalar() or 0
-    )
-    total_search_calls = (
-        db.query(func.sum(Session.total_search_calls))
-        .filter(Session.created_at >= cutoff)
-        .scalar() or 0
-    )
-    
-    # Estimated cost
-    total_cost = (
-        db.query(func.sum(Session.estimated_cost_usd))
-        .filter(Session.created_at >= cutoff)
-        .scalar() or 0
-    )
-    
-    # Sessions per day for chart
+    # Sessions per day for chart: one grouped query over [first day, tomorrow),
+    # zero-filled in Python. Days are bucketed by the database's date(), which
+    # is UTC for SQLite and for Supabase's default session time zone.
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=days - 1)
+    day_bucket = func.date(Session.created_at)
+    counts_by_day = {
+        str(day): count
+        for day, count in (
+            db.query(day_bucket, func.count(Session.id))
+            .filter(Session.created_at >= datetime.combine(first_day, datetime.min.time(), timezone.utc))
+            .filter(Session.created_at < datetime.combine(today + timedelta(days=1), datetime.min.time(), timezone.utc))
+            .group_by(day_bucket)
+            .all()
+        )
+    }
     sessions_per_day = []
     for i in range(days):
-        day = datetime.now(timezone.utc).date() - timedelta(days=i)
-        day_start = datetime.combine(day, datetime.min.time(), timezone.utc)
-        day_end = datetime.combine(day, datetime.max.time(), timezone.utc)
-        count = (
-            db.query(Session)
-            .filter(Session.created_at >= day_start)
-            .filter(Session.created_at <= day_end)
-            .count()
-        )
+        day = (first_day + timedelta(days=i)).isoformat()
         sessions_per_day.append({
-            "date": day.isoformat(),
-            "count": count,
+            "date": day,
+            "count": counts_by_day.get(day, 0),
         })
-    sessions_per_day.reverse()
     
     # Top companies researched
     top_companies = (
@@ -165,8 +282,33 @@ def get_dashboard_stats(
 # Session List
 # =============================================================================
 
+# Columns read by Session.to_list_dict()
+_LIST_COLUMNS = (
+    Session.id, Session.created_at, Session.updated_at, Session.completed_at,
+    Session.status, Session.company_name, Session.company_domain, Session.country,
+    Session.is_manual_entry, Session.service_category, Session.is_in_scope,
+    Session.is_vlop, Session.applicable_obligations_count, Session.total_obligations_count,
+    Session.total_duration_seconds, Session.total_llm_calls, Session.total_search_calls,
+    Session.total_tokens_used, Session.estimated_cost_usd, Session.error_message,
+)
+
+
+def _encode_cursor(session: Session) -> str:
+    """Opaque keyset cursor pointing just past this session."""
+    raw = f"{session.created_at.isoformat()}|{session.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, session_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), session_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/sessions")
-def list_sessions(
+async def list_sessions(
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
     page: int = Query(default=1, ge=1),
@@ -174,8 +316,28 @@ def list_sessions(
     status: Optional[str] = Query(default=None),
     company: Optional[str] = Query(default=None),
     days: Optional[int] = Query(default=None, ge=1, le=365),
+    cursor: Optional[str] = Query(default=None),
 ):
-    """List sessions with pagination and filtering."""
+    """List sessions with pagination and filtering.
+
+    Pass the previous response's `next_cursor` as `cursor` for keyset
+    pagination: no OFFSET scan and no COUNT, so `total`/`total_pages` are
+    omitted and `page` is ignored.
+    """
+    if cursor:
+        cursor = _decode_cursor(cursor)
+    return await _run_db(_list_sessions, db, page, page_size, status, company, days, cursor)
+
+
+def _list_sessions(
+    db: DBSession,
+    page: int,
+    page_size: int,
+    status: Optional[str],
+    company: Optional[str],
+    days: Optional[int],
+    cursor: Optional[tuple[datetime, str]],
+) -> dict:
     query = db.query(Session)
     
     # Filters
@@ -192,41 +354,115 @@ def list_sessions(
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         query = query.filter(Session.created_at >= cutoff)
     
-    # Total count
-    total = query.count()
-    
-    # Paginate
-    query = query.order_by(desc(Session.created_at))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    if cursor:
+        cursor_created_at, cursor_id = cursor
+        query = query.filter(or_(
+            Session.created_at < cursor_created_at,
+            and_(Session.created_at == cursor_created_at, Session.id < cursor_id),
+        ))
+    else:
+        # Total count (served by the created_at/status and company_name
+        # trigram indexes)
+        total = query.with_entities(func.count(Session.id)).scalar()
+    
+    # Paginate; id breaks created_at ties so cursors are stable.
+    # One extra row tells us whether another page follows.
+    query = query.order_by(desc(Session.created_at), desc(Session.id))
+    if not cursor:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size + 1)
+    # to_list_dict() counts steps and chat messages; load their ids for the
+    # whole page at once instead of two lazy loads per row, and skip the
+    # JSON report columns the list never shows.
+    query = query.options(
+        load_only(*_LIST_COLUMNS),
+        selectinload(Session.steps).load_only(SessionStep.id),
+        selectinload(Session.chat_messages).load_only(ChatMessage.id),
+    )
     
     sessions = query.all()
+    has_more = len(sessions) > page_size
+    sessions = sessions[:page_size]
     
-    return {
-        "sessions": [s.to_dict() for s in sessions],
-        "total": total,
-        "page": page,
+    result = {
+        "sessions": [s.to_list_dict() for s in sessions],
         "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size,
+        "has_more": has_more,
+        "next_cursor": _encode_cursor(sessions[-1]) if has_more else None,
     }
+    if not cursor:
+        result.update({
+            "total": total,
+            "page": page,
+            "total_pages": (total + page_size - 1) // page_size,
+        })
+    return result
+
+
+# =============================================================================
+# Conditional Requests
+# =============================================================================
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {c.strip().removeprefix("W/") for c in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _json_with_etag(request: Request, payload: dict) -> Response:
+    """Serialize a payload once and answer 304 if the client already has it."""
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 # =============================================================================
 # Session Detail
 # =============================================================================
 
+def _get_session_with_history(db: DBSession, session_id: str) -> Optional[Session]:
+    """Load a session with its steps and chat messages in one query each.
+
+    Any other relationship access raises instead of silently lazy-loading.
+    """
+    return (
+        db.query(Session)
+        .options(
+            selectinload(Session.steps),
+            selectinload(Session.chat_messages),
+            raiseload("*"),
+        )
+        .filter(Session.id == session_id)
+        .first()
+    )
+
+
+def _get_session_detail(db: DBSession, session_id: str) -> Optional[dict]:
+    session = _get_session_with_history(db, session_id)
+    return session.to_detail_dict() if session else None
+
+
 @router.get("/sessions/{session_id}")
-def get_session(
+async def get_session(
     session_id: str,
+    request: Request,
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
 ):
     """Get detailed session information including steps and chat messages."""
-    session = db.query(Session).filter(Session.id == session_id).first()
+    detail = await _run_db(_get_session_detail, db, session_id)
     
-    if not session:
+    if detail is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return session.to_detail_dict()
+    # Steps and messages change without touching sessions.updated_at, so the
+    # ETag is derived from the payload itself.
+    return _json_with_etag(request, detail)
 
 
 # =============================================================================
@@ -234,67 +470,94 @@ def get_session(
 # =============================================================================
 
 @router.get("/sessions/{session_id}/timeline")
-def get_session_timeline(
+async def get_session_timeline(
     session_id: str,
+    request: Request,
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
 ):
     """Get a timeline of all events in a session."""
-    session = db.query(Session).filter(Session.id == session_id).first()
+    timeline = await _run_db(_build_session_timeline, db, session_id)
     
-    if not session:
+    if timeline is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    timeline = []
+    return _json_with_etag(request, {"session_id": session_id, "timeline": timeline})
+
+
+def _build_session_timeline(db: DBSession, session_id: str) -> Optional[list]:
+    session = db.query(Session).options(raiseload("*")).filter(Session.id == session_id).first()
     
-    # Add session start
-    timeline.append({
-        "timestamp": session.created_at.isoformat(),
+    if not session:
+        return None
+    
+    # Each event source is fetched as plain columns already ordered by the
+    # database, then merged; no ORM objects for steps/messages, no final sort.
+    # The middle element ranks events that share a timestamp the way they
+    # have always been listed: session start, each step's start then
+    # completion, chat messages, session completion.
+    session_events = [(session.created_at, (0,), {
         "type": "session_start",
         "title": "Assessment Started",
         "details": {"status": session.status.value if session.status else None},
-    })
+    })]
     
     # Add steps
-    for step in session.steps:
-        timeline.append({
-            "timestamp": step.created_at.isoformat(),
-            "type": f"step_{step.step_type.value}",
-            "title": f"{step.step_type.value.replace('_', ' ').title()} Started",
-            "details": {
-                "request": step.request_data,
-                "status": step.status,
-            },
-        })
-        if step.completed_at:
-            timeline.append({
-                "timestamp": step.completed_at.isoformat(),
-                "type": f"step_{step.step_type.value}_complete",
-                "title": f"{step.step_type.value.replace('_', ' ').title()} Completed",
-                "details": {
-                    "duration_seconds": step.duration_seconds,
-                    "llm_calls": step.llm_calls,
-                    "search_calls": step.search_calls,
-                    "response_preview": str(step.response_data)[:500] if step.response_data else None,
-                },
-            })
+    steps = (
+        db.query(
+            SessionStep.created_at,
+            SessionStep.completed_at,
+            SessionStep.step_type,
+            SessionStep.status,
+            SessionStep.request_data,
+            SessionStep.response_data,
+            SessionStep.duration_seconds,
+            SessionStep.llm_calls,
+            SessionStep.search_calls,
+        )
+        .filter(SessionStep.session_id == session_id)
+        .order_by(SessionStep.created_at)
+        .all()
+    )
+    step_started = [(step.created_at, (1, i, 0), {
+        "type": f"step_{step.step_type.value}",
+        "title": f"{step.step_type.value.replace('_', ' ').title()} Started",
+        "details": {
+            "request": step.request_data,
+            "status": step.status,
+        },
+    }) for i, step in enumerate(steps)]
+    # Steps can finish out of start order, so completions get their own order.
+    step_completed = sorted(((step.completed_at, (1, i, 1), {
+        "type": f"step_{step.step_type.value}_complete",
+        "title": f"{step.step_type.value.replace('_', ' ').title()} Completed",
+        "details": {
+            "duration_seconds": step.duration_seconds,
+            "llm_calls": step.llm_calls,
+            "search_calls": step.search_calls,
+            "response_preview": str(step.response_data)[:500] if step.response_data else None,
+        },
+    }) for i, step in enumerate(steps) if step.completed_at), key=itemgetter(0, 1))
     
     # Add chat messages
-    for msg in session.chat_messages:
-        timeline.append({
-            "timestamp": msg.created_at.isoformat(),
-            "type": f"chat_{msg.role}",
-            "title": f"Chat: {msg.role.title()}",
-            "details": {
-                "content": msg.content[:500] if msg.content else None,
-                "tools_used": msg.tools_used,
-            },
-        })
+    messages = (
+        db.query(ChatMessage.created_at, ChatMessage.role, ChatMessage.content, ChatMessage.tools_used)
+        .filter(ChatMessage.session_id == session_id)
+        .order_by(ChatMessage.created_at)
+        .all()
+    )
+    chat_events = [(msg.created_at, (2, j), {
+        "type": f"chat_{msg.role}",
+        "title": f"Chat: {msg.role.title()}",
+        "details": {
+            "content": msg.content[:500] if msg.content else None,
+            "tools_used": msg.tools_used,
+        },
+    }) for j, msg in enumerate(messages)]
     
     # Add session completion if applicable
     if session.completed_at:
-        timeline.append({
-            "timestamp": session.completed_at.isoformat(),
+        session_events.append((session.completed_at, (3,), {
             "type": "session_complete",
             "title": "Assessment Completed",
             "details": {
@@ -302,47 +565,65 @@ def get_session_timeline(
                 "service_category": session.service_category,
                 "obligations_count": session.applicable_obligations_count,
             },
-        })
-    
-    # Sort by timestamp
-    timeline.sort(key=lambda x: x["timestamp"])
+        }))
     
-    return {"session_id": session_id, "timeline": timeline}
+    return [
+        # orjson writes datetimes in ISO 8601, same as isoformat()
+        {"timestamp": timestamp, **event}
+        for timestamp, _, event in heapq.merge(
+            session_events, step_started, step_completed, chat_events, key=itemgetter(0, 1)
+        )
+    ]
 
 
 # =============================================================================
 # PDF Export
 # =============================================================================
 
-@router.get("/sessions/{session_id}/export/pdf")
-def export_session_pdf(
-    session_id: str,
-    admin: str = Depends(verify_admin),
-    db: DBSession = Depends(get_db),
-):
-    """Export session as PDF report."""
-    session = db.query(Session).filter(Session.id == session_id).first()
-    
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import mm
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
-    except ImportError:
-        raise HTTPException(
-            status_code=500,
-            detail="PDF export requires reportlab. Install with: pip install reportlab"
-        )
-    
-    # Create PDF buffer
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=20*mm, bottomMargin=20*mm)
-    
+# Rendered reports keyed by session fingerprint (id + updated_at). Building a
+# PDF with reportlab dominates export time; re-downloads of an unchanged
+# session are served from here.
+PDF_CACHE_SIZE = int(os.getenv("ADMIN_PDF_CACHE_SIZE", "32"))
+
+# Renders are CPU-bound and can take seconds; run them on their own small
+# worker budget so a burst of exports can't occupy the shared threadpool
+# that every sync endpoint and DB dependency runs on.
+PDF_RENDER_CONCURRENCY = int(os.getenv("ADMIN_PDF_RENDER_CONCURRENCY", "2"))
+_pdf_render_limiter = anyio.CapacityLimiter(PDF_RENDER_CONCURRENCY)
+
+_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_pdf_lock = threading.Lock()
+
+
+def _get_cached_pdf(fingerprint: str) -> Optional[bytes]:
+    """Return the cached report for this session version, if any."""
+    with _pdf_lock:
+        pdf = _pdf_cache.get(fingerprint)
+        if pdf is not None:
+            _pdf_cache.move_to_end(fingerprint)
+        return pdf
+
+
+def _set_cached_pdf(fingerprint: str, pdf: bytes) -> None:
+    """Store a rendered report, evicting the least recently used ones."""
+    with _pdf_lock:
+        _pdf_cache[fingerprint] = pdf
+        while len(_pdf_cache) > PDF_CACHE_SIZE:
+            _pdf_cache.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _pdf_styles():
+    """Build the report's paragraph and table styles once per process.
+
+    Returns (title, heading, normal, body, info_table, legacy_table). Callers
+    only read these, so they are shared across renders.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -358,13 +639,45 @@ def export_session_pdf(
         spaceBefore=20,
         spaceAfter=10,
     )
-    body_style = styles['BodyText']
+    legacy_commands = [
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('PADDING', (0, 0), (-1, -1), 8),
+    ]
+    info_table_style = TableStyle(legacy_commands + [('VALIGN', (0, 0), (-1, -1), 'TOP')])
+    return (
+        title_style,
+        heading_style,
+        styles['Normal'],
+        styles['BodyText'],
+        info_table_style,
+        TableStyle(legacy_commands),
+    )
+
+
+def _render_session_pdf(session: Session) -> bytes:
+    """Build the assessment report PDF for a session."""
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import mm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+    except ImportError:
+        raise HTTPException(
+            status_code=500,
+            detail="PDF export requires reportlab. Install with: pip install reportlab"
+        )
+    
+    # Create PDF buffer
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=20*mm, bottomMargin=20*mm)
+    
+    title_style, heading_style, normal_style, body_style, info_table_style, legacy_table_style = _pdf_styles()
     
     story = []
     
     # Title
     story.append(Paragraph("DSA Compliance Assessment Report", title_style))
-    story.append(Paragraph(f"Generated by Corinna", styles['Normal']))
+    story.append(Paragraph(f"Generated by Corinna", normal_style))
     story.append(Spacer(1, 20))
     
     # Session Info
@@ -378,12 +691,7 @@ def export_session_pdf(
         ["Duration", f"{session.total_duration_seconds:.1f}s" if session.total_duration_seconds else "N/A"],
     ]
     t = Table(session_data, colWidths=[100, 350])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('PADDING', (0, 0), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    t.setStyle(info_table_style)
     story.append(t)
     story.append(Spacer(1, 20))
     
@@ -419,12 +727,7 @@ def export_session_pdf(
             ],
         ]
         t = Table(classification_data, colWidths=[150, 300])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        t.setStyle(info_table_style)
         story.append(t)
         story.append(Spacer(1, 10))
 
@@ -457,11 +760,7 @@ def export_session_pdf(
             ["Applicable Obligations", f"{session.applicable_obligations_count or 0} of {session.total_obligations_count or 0}"],
         ]
         t = Table(classification_data, colWidths=[150, 300])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
+        t.setStyle(legacy_table_style)
         story.append(t)
         story.append(Spacer(1, 20))
     
@@ -504,37 +803,70 @@ def export_session_pdf(
         if obligations:
             story.append(Paragraph("Compliance Obligations", heading_style))
 
-        for obl in obligations:
-            applies = obl.get("applies", False)
+        # Read each obligation's fields once, then emit its flowables in one go
+        rows = [
+            (
+                o.get("article", "?"),
+                o.get("title", "Unknown"),
+                o.get("applies", False),
+                o.get("implications", ""),
+                o.get("action_items", []),
+            )
+            for o in obligations
+        ]
+        for article, title, applies, implications, action_items in rows:
             status_text = "✓ Applies" if applies else "○ Does not apply"
-            story.append(Paragraph(
-                f"<b>Article {obl.get('article', '?')}: {obl.get('title', 'Unknown')}</b> - {status_text}",
-                body_style
-            ))
-            implications = obl.get("implications", "")
+            story.append(Paragraph(f"<b>Article {article}: {title}</b> - {status_text}", body_style))
             if implications:
                 # Do not truncate – include the full implications text from the service categorizer
                 story.append(Paragraph(f"<i>{implications}</i>", body_style))
-
-            action_items = obl.get("action_items", [])
             if action_items:
                 story.append(Paragraph("Action items:", body_style))
-                for item in action_items:
-                    story.append(Paragraph(f"  • {item}", body_style))
-
+                story.extend(Paragraph(f"  • {item}", body_style) for item in action_items)
             story.append(Spacer(1, 10))
     
     # Build PDF
     doc.build(story)
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+@router.get("/sessions/{session_id}/export/pdf")
+async def export_session_pdf(
+    session_id: str,
+    request: Request,
+    admin: str = Depends(verify_admin),
+    db: DBSession = Depends(get_db),
+):
+    """Export session as PDF report."""
+    # The report only reads session columns; never load steps or messages.
+    session = await _run_db(
+        lambda: db.query(Session).options(raiseload("*")).filter(Session.id == session_id).first()
+    )
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    # Every column the report reads bumps updated_at, so an unchanged session
+    # skips the reportlab build entirely.
+    fingerprint = f"{session.id}:{session.updated_at.isoformat() if session.updated_at else ''}"
+    etag = f'"{hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    pdf = _get_cached_pdf(fingerprint)
+    if pdf is None:
+        pdf = await anyio.to_thread.run_sync(
+            _render_session_pdf, session, limiter=_pdf_render_limiter
+        )
+        _set_cached_pdf(fingerprint, pdf)
     
     filename = f"corinna_assessment_{session.company_name or session_id}_{datetime.now(timezone.utc).strftime('%Y%m%d')}.pdf"
     filename = filename.replace(" ", "_").replace("/", "_")
     
     return Response(
-        content=buffer.getvalue(),
+        content=pdf,
         media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "ETag": etag},
     )
 
 
@@ -542,20 +874,26 @@ def export_session_pdf(
 # Delete Session
 # =============================================================================
 
+def _delete_session(db: DBSession, session_id: str) -> bool:
+    session = db.query(Session).filter(Session.id == session_id).first()
+    if not session:
+        return False
+    db.delete(session)
+    db.commit()
+    return True
+
+
 @router.delete("/sessions/{session_id}")
-def delete_session(
+async def delete_session(
     session_id: str,
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
 ):
     """Delete a session and all related data."""
-    session = db.query(Session).filter(Session.id == session_id).first()
-    
-    if not session:
+    if not await _run_db(_delete_session, db, session_id):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    db.delete(session)
-    db.commit()
+    _invalidate_stats()
     
     return {"status": "deleted", "session_id": session_id}
 
@@ -564,8 +902,15 @@ def delete_session(
 # Bulk Operations
 # =============================================================================
 
+def _delete_sessions_before(db: DBSession, cutoff: datetime) -> int:
+    # One bulk DELETE; its rowcount is the number of sessions removed.
+    count = db.query(Session).filter(Session.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return count
+
+
 @router.delete("/sessions/cleanup/old")
-def cleanup_old_sessions(
+async def cleanup_old_sessions(
     admin: str = Depends(verify_admin),
     db: DBSession = Depends(get_db),
     days: int = Query(default=30, ge=7, le=365),
@@ -573,9 +918,8 @@ def cleanup_old_sessions(
     """Delete sessions older than N days."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     
-    count = db.query(Session).filter(Session.created_at < cutoff).count()
-    db.query(Session).filter(Session.created_at < cutoff).delete()
-    db.commit()
+    count = await _run_db(_delete_sessions_before, db, cutoff)
+    _invalidate_stats()
     
     return {"deleted_count": count, "cutoff_date": cutoff.isoformat()}
 
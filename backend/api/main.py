@@ -80,10 +80,12 @@ except ImportError as e:
 
 try:
     from service_categorizer.graph import service_categorizer
+    from service_categorizer.graph import warm_up as warm_up_service_categorizer
     from service_categorizer.state import ServiceCategorizerInputState
 except ImportError as e:
     print(f"Warning: Could not import service_categorizer: {e}")
     service_categorizer = None
+    warm_up_service_categorizer = None
     ServiceCategorizerInputState = None
 
 try:
@@ -405,6 +407,13 @@ async def lifespan(app: FastAPI):
             DB_AVAILABLE = False
             tracker = None
     
+    # Pay first-request costs (prompt compilation, DSA document parse) now.
+    if warm_up_service_categorizer is not None:
+        try:
+            await warm_up_service_categorizer()
+        except Exception as e:
+            print(f"✗ Service categorizer warm-up failed: {e}")
+
     print("✓ DSA Copilot API ready")
     print(f"  - Company Matcher: {'✓' if company_matcher else '✗'}")
     print(f"  - Company Researcher: {'✓' if company_researcher else '✗'}")
@@ -414,6 +423,13 @@ async def lifespan(app: FastAPI):
     print(f"  - Admin Dashboard: {'✓' if admin_router else '✗'}")
     yield
 
+    # Release pooled Tavily connections shared across agent runs.
+    try:
+        from tools import close_clients as close_tavily_clients
+        await close_tavily_clients()
+    except Exception as e:
+        print(f"✗ Tavily client shutdown failed: {e}")
+
 
 app = FastAPI(
     title="DSA Copilot API",
@@ -914,17 +930,20 @@ async def service_categorizer_stream(request: ServiceCategorizerRequest):
             {"company_profile": request.company_profile},
         )
     
+    profile_json = json.dumps(request.company_profile)
     input_state: ServiceCategorizerInputState = {
-        "messages": [HumanMessage(content=json.dumps(request.company_profile))],
+        "messages": [HumanMessage(content=profile_json)],
         "top_domain": (request.top_domain or "").strip() or None,
         "summary_long": (request.summary_long or "").strip() or None,
+        "company_profile_json": profile_json,
     }
     
     def extract_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         final_report = result.get("final_report", "")
         if final_report:
             try:
-                parsed = json.loads(final_report)
+                # The structured report is on state; only re-parse for older graphs.
+                parsed = result.get("report") or json.loads(final_report)
                 # Update session with classification results
                 if session_id and DB_AVAILABLE and tracker:
                     classification = parsed.get("classification", {})
@@ -1004,16 +1023,18 @@ async def service_categorizer_invoke(request: ServiceCategorizerRequest):
         raise HTTPException(status_code=503, detail="Service categorizer not available")
     
     try:
+        profile_json = json.dumps(request.company_profile)
         input_state: ServiceCategorizerInputState = {
-            "messages": [HumanMessage(content=json.dumps(request.company_profile))],
+            "messages": [HumanMessage(content=profile_json)],
             "top_domain": (request.top_domain or "").strip() or None,
             "summary_long": (request.summary_long or "").strip() or None,
+            "company_profile_json": profile_json,
         }
         result = await service_categorizer.ainvoke(input_state)
         final_report = result.get("final_report", "")
         
         if final_report:
-            return json.loads(final_report)
+            return result.get("report") or json.loads(final_report)
         else:
             raise HTTPException(status_code=500, detail="No report generated")
     except Exception as e:
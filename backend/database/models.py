@@ -125,8 +125,12 @@ class Session(Base):
     steps = relationship("SessionStep", back_populates="session", cascade="all, delete-orphan", order_by="SessionStep.created_at")
     chat_messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan", order_by="ChatMessage.created_at")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API responses."""
+    def to_list_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for list views, without the large JSON columns.
+
+        Leaves out research_summary and compliance_report so list queries can
+        skip loading them.
+        """
         return {
             "id": self.id,
             "created_at": self.created_at.isoformat() if self.created_at else None,
@@ -137,13 +141,11 @@ class Session(Base):
             "company_domain": self.company_domain,
             "country": self.country,
             "is_manual_entry": self.is_manual_entry,
-            "research_summary": self.research_summary,
             "service_category": self.service_category,
             "is_in_scope": self.is_in_scope,
             "is_vlop": self.is_vlop,
             "applicable_obligations_count": self.applicable_obligations_count,
             "total_obligations_count": self.total_obligations_count,
-            "compliance_report": self.compliance_report,
             "total_duration_seconds": self.total_duration_seconds,
             "total_llm_calls": self.total_llm_calls,
             "total_search_calls": self.total_search_calls,
@@ -154,6 +156,13 @@ class Session(Base):
             "chat_messages_count": len(self.chat_messages) if self.chat_messages else 0,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        base = self.to_list_dict()
+        base["research_summary"] = self.research_summary
+        base["compliance_report"] = self.compliance_report
+        return base
+
     def to_detail_dict(self) -> Dict[str, Any]:
         """Convert to detailed dictionary including steps and messages."""
         base = self.to_dict()
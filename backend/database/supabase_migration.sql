@@ -140,6 +140,13 @@ CREATE INDEX IF NOT EXISTS idx_sessions_company_name ON sessions(company_name);
 CREATE INDEX IF NOT EXISTS idx_sessions_company_domain ON sessions(company_domain);
 CREATE INDEX IF NOT EXISTS idx_sessions_service_category ON sessions(service_category);
 
+-- Admin session list: filter by status within a date window, newest first
+CREATE INDEX IF NOT EXISTS idx_sessions_created_at_status ON sessions(created_at DESC, status);
+
+-- Admin company search uses ILIKE '%term%', which a btree index cannot serve
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_sessions_company_name_trgm ON sessions USING gin (company_name gin_trgm_ops);
+
 -- Session steps indexes
 CREATE INDEX IF NOT EXISTS idx_session_steps_session_id ON session_steps(session_id);
 CREATE INDEX IF NOT EXISTS idx_session_steps_step_type ON session_steps(step_type);
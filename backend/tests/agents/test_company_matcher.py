@@ -148,6 +148,49 @@ class TestCompanyMatcherNodes:
         # Should use extended_summary as summary_long
         assert "Extended description" in parsed["exact_match"]["summary_long"]
 
+    def test_route_after_tools_finalizes_after_finish_matching(self):
+        """Test the graph skips the extra agent turn once finish_matching ran."""
+        from company_matcher.graph import route_after_tools
+        from langchain_core.messages import AIMessage, ToolMessage
+
+        call = AIMessage(
+            content="",
+            tool_calls=[{"name": "finish_matching", "args": {"result_json": "{}"}, "id": "call_1"}],
+        )
+        state = {"messages": [call, ToolMessage(content="Matching complete: {}", tool_call_id="call_1")]}
+
+        assert route_after_tools(state) == "finalize"
+
+    def test_route_after_tools_returns_to_agent_after_search(self):
+        """Test web_search results are sent back to the agent."""
+        from company_matcher.graph import route_after_tools
+        from langchain_core.messages import AIMessage, ToolMessage
+
+        call = AIMessage(
+            content="",
+            tool_calls=[{"name": "web_search", "args": {"queries": ["acme"]}, "id": "call_1"}],
+        )
+        state = {"messages": [call, ToolMessage(content="Search Results", tool_call_id="call_1")]}
+
+        assert route_after_tools(state) == "agent"
+
+    @pytest.mark.asyncio
+    async def test_finalize_result_reads_finish_matching_tool_message(self, sample_company_match):
+        """Test finalize_result parses the payload echoed by finish_matching."""
+        from company_matcher.graph import finalize_result
+        from langchain_core.messages import ToolMessage
+
+        payload = json.dumps({"exact_match": sample_company_match, "suggestions": []})
+        state = {
+            "company_name": "Acme Corporation",
+            "messages": [ToolMessage(content=f"Matching complete: {payload}", tool_call_id="call_1")],
+        }
+
+        result = await finalize_result(state)
+
+        parsed = json.loads(result["match_result"])
+        assert parsed["exact_match"]["top_domain"] == "acme.com"
+
     @pytest.mark.asyncio
     async def test_finalize_result_handles_invalid_json(self):
         """Test finalize_result handles invalid JSON gracefully."""
@@ -195,6 +238,64 @@ class TestCompanyMatcherTools:
         assert "Matching complete" in result
 
 
+    @pytest.mark.asyncio
+    async def test_web_search_sends_capped_queries_in_one_call(self):
+        """Test web_search hands all its queries to one Tavily call so results are deduped."""
+        from company_matcher.graph import MAX_QUERIES_PER_CALL, web_search
+
+        mock_search = AsyncMock(return_value="Search Results:")
+        queries = [f"q{i}" for i in range(MAX_QUERIES_PER_CALL + 2)]
+
+        with patch("company_matcher.graph.tavily_search_tool", mock_search):
+            result = await web_search.ainvoke({"queries": queries})
+
+        mock_search.assert_awaited_once()
+        assert mock_search.call_args.kwargs["queries"] == queries[:MAX_QUERIES_PER_CALL]
+        assert result == "Search Results:"
+
+    @pytest.mark.asyncio
+    async def test_tool_node_runs_web_searches_concurrently(self):
+        """Test multiple web_search calls from one turn are dispatched in parallel."""
+        import asyncio
+        from company_matcher.graph import tool_node
+        from langchain_core.messages import AIMessage
+        from langgraph.graph import END, START, MessagesState, StateGraph
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_search(queries, max_results, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return f"results for {queries[0]}"
+
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "web_search", "args": {"queries": ["a"]}, "id": "call_1"},
+                {"name": "web_search", "args": {"queries": ["b"]}, "id": "call_2"},
+                {"name": "web_search", "args": {"queries": ["c"]}, "id": "call_3"},
+            ],
+        )
+
+        builder = StateGraph(MessagesState)
+        builder.add_node("tools", tool_node)
+        builder.add_edge(START, "tools")
+        builder.add_edge("tools", END)
+
+        with patch("company_matcher.graph.tavily_search_tool", side_effect=fake_search):
+            result = await builder.compile().ainvoke({"messages": [message]})
+
+        tool_messages = result["messages"][1:]
+        assert peak == 3
+        # Results come back matched to their call ids, in the original order.
+        assert [m.tool_call_id for m in tool_messages] == ["call_1", "call_2", "call_3"]
+        assert tool_messages[1].content == "results for b"
+
+
 class TestCompanyMatcherGraph:
     """Tests for company_matcher graph structure."""
 
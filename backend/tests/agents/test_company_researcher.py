@@ -166,6 +166,202 @@ class TestCompanyResearcherNodes:
         assert parsed["company_name"] == "TestCorp"
         assert len(parsed["answers"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_research_question_respects_max_concurrent_research(self):
+        """Test research_question never runs more subgraphs than the configured limit."""
+        import asyncio
+        from company_researcher import graph
+
+        running = 0
+        peak = 0
+
+        async def fake_subgraph(state, config=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"messages": [], "completed_answers": [{"question": state["question"]}]}
+
+        config = {"configurable": {"max_concurrent_research": 2}}
+        states = [
+            {
+                "question": f"Q{i}?",
+                "company_name": "TestCorp",
+                "prompt_template": f"questions/q{i:02d}.jinja",
+            }
+            for i in range(6)
+        ]
+
+        with patch.object(graph.research_subgraph, "ainvoke", side_effect=fake_subgraph), \
+             patch.object(graph, "get_cached_answers", return_value=None), \
+             patch.object(graph, "set_cached_answers"):
+            results = await asyncio.gather(
+                *[graph.research_question(s, config) for s in states]
+            )
+
+        assert peak == 2
+        assert [r["completed_answers"][0]["question"] for r in results] == [
+            s["question"] for s in states
+        ]
+
+    def test_research_semaphore_is_per_event_loop(self):
+        """Test runs on different event loops never share a research semaphore."""
+        import asyncio
+        from company_researcher.graph import _research_semaphore
+
+        async def get():
+            first = _research_semaphore(2)
+            assert _research_semaphore(2) is first
+            assert _research_semaphore(3) is not first
+            return first
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    @pytest.mark.asyncio
+    async def test_research_agent_keeps_static_prompt_prefix(self):
+        """Test the question prompt is company-independent and precedes the company context."""
+        from langchain_core.messages import AIMessage, SystemMessage
+        from company_researcher import graph
+        from company_researcher.graph import research_agent
+
+        graph._get_model.cache_clear()
+        graph._get_research_model.cache_clear()
+        sent = []
+
+        async def fake_ainvoke(messages):
+            sent.append(messages)
+            return AIMessage(content="done")
+
+        mock_model = MagicMock()
+        mock_model.bind_tools.return_value.ainvoke = fake_ainvoke
+
+        with patch("company_researcher.graph.ChatOpenAI", return_value=mock_model) as chat_cls:
+            for company in ("Acme", "Globex"):
+                await research_agent({
+                    "company_name": company,
+                    "prompt_template": "questions/q00.jinja",
+                    "messages": [],
+                })
+        graph._get_model.cache_clear()
+        graph._get_research_model.cache_clear()
+
+        # One shared client serves both questions
+        assert chat_cls.call_count == 1
+
+        first, second = sent
+        assert isinstance(first[0], SystemMessage)
+        assert first[0].content == second[0].content
+        assert "Acme" not in first[0].content
+        assert "Acme" in first[1].content and "Globex" in second[1].content
+
+    @pytest.mark.asyncio
+    async def test_research_question_serves_cached_answers(self, sample_subquestion_answer):
+        """Test a cached answer skips the research subgraph entirely."""
+        from company_researcher import graph
+
+        state = {
+            "question": "Q?",
+            "company_name": "TestCorp",
+            "prompt_template": "questions/q00.jinja",
+        }
+        subgraph = AsyncMock()
+
+        with patch.object(graph.research_subgraph, "ainvoke", subgraph), \
+             patch.object(graph, "get_cached_answers", return_value=[sample_subquestion_answer]):
+            result = await graph.research_question(state)
+
+        subgraph.assert_not_called()
+        assert result["completed_answers"] == [sample_subquestion_answer]
+
+    @pytest.mark.asyncio
+    async def test_research_question_does_not_cache_summarizer_errors(self):
+        """Test failed summarizations are not written to the answer cache."""
+        from company_researcher import graph
+
+        state = {
+            "question": "Q?",
+            "company_name": "TestCorp",
+            "prompt_template": "questions/q00.jinja",
+        }
+        subgraph_result = {
+            "messages": [],
+            "research_summary": "Error: timeout",
+            "completed_answers": [{"question": "Q?"}],
+        }
+
+        with patch.object(graph.research_subgraph, "ainvoke", AsyncMock(return_value=subgraph_result)), \
+             patch.object(graph, "get_cached_answers", return_value=None), \
+             patch.object(graph, "set_cached_answers") as set_cached:
+            await graph.research_question(state)
+
+        set_cached.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "payload,expected_section",
+        [
+            ([{"section": "S", "question": "Q?", "answer": "A"}], "S"),
+            ([{"question": "Q?"}], None),
+        ],
+    )
+    def test_get_cached_answers_validates_entries(self, payload, expected_section):
+        """Test cached answers are validated on read; invalid entries are a miss."""
+        from company_researcher import cache
+
+        client = MagicMock()
+        client.get.return_value = json.dumps(payload)
+
+        with patch.object(cache, "_get_redis_client", return_value=client):
+            answers = cache.get_cached_answers("research:key")
+
+        if expected_section is None:
+            assert answers is None
+        else:
+            assert answers[0]["section"] == expected_section
+            assert answers[0]["information_found"] is True
+
+    @pytest.mark.asyncio
+    async def test_tools_node_runs_web_searches_concurrently(self):
+        """Test web_search calls from one agent turn are dispatched in parallel."""
+        import asyncio
+        from langchain_core.messages import AIMessage
+        from langgraph.graph import END, START, StateGraph
+        from company_researcher.graph import tools_with_iteration_counter
+        from company_researcher.state import QuestionResearchState
+
+        running = 0
+        peak = 0
+
+        async def fake_search(queries, max_results, config):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"results for {queries[0]}"
+
+        builder = StateGraph(QuestionResearchState)
+        builder.add_node("tools", tools_with_iteration_counter)
+        builder.add_edge(START, "tools")
+        builder.add_edge("tools", END)
+        tools_graph = builder.compile()
+
+        msg = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "web_search", "id": str(i), "args": {"queries": [f"q{i}"]}}
+                for i in range(3)
+            ],
+        )
+
+        with patch("company_researcher.researcher.tavily_search_tool", side_effect=fake_search):
+            result = await tools_graph.ainvoke({"messages": [msg], "iterations": 0})
+
+        assert peak == 3
+        assert result["iterations"] == 1
+        tool_messages = result["messages"][1:]
+        assert [m.tool_call_id for m in tool_messages] == ["0", "1", "2"]
+
 
 class TestCompanyResearcherTools:
     """Tests for company_researcher tool definitions."""
@@ -189,6 +385,78 @@ class TestCompanyResearcherTools:
         
         assert "Research complete" in result
 
+    @pytest.mark.asyncio
+    async def test_web_search_joins_identical_inflight_queries(self):
+        """Test concurrent identical searches share a single Tavily request."""
+        import asyncio
+        from company_researcher.researcher import web_search
+
+        calls = []
+
+        async def fake_search(queries, max_results, config):
+            calls.append(queries)
+            await asyncio.sleep(0.01)
+            return f"results for {queries[0]}"
+
+        with patch("company_researcher.researcher.tavily_search_tool", side_effect=fake_search):
+            results = await asyncio.gather(
+                web_search.ainvoke({"queries": ["Acme headcount"]}),
+                web_search.ainvoke({"queries": ["acme headcount "]}),
+                web_search.ainvoke({"queries": ["Acme revenue"]}),
+            )
+
+        assert len(calls) == 2
+        assert results[0] == results[1] == "results for Acme headcount"
+        assert results[2] == "results for Acme revenue"
+
+
+    @pytest.mark.asyncio
+    async def test_dedupe_inflight_separates_api_keys_and_result_limits(self):
+        """Test searches only join when API key and max_results match too."""
+        import asyncio
+        from company_researcher.search_cache import dedupe_inflight
+
+        calls = []
+
+        async def search():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "results"
+
+        await asyncio.gather(
+            dedupe_inflight(["acme"], 3, search, api_key="key-a"),
+            dedupe_inflight(["acme"], 3, search, api_key="key-a"),
+            dedupe_inflight(["acme"], 3, search, api_key="key-b"),
+            dedupe_inflight(["acme"], 5, search, api_key="key-a"),
+        )
+
+        assert len(calls) == 3
+
+    def test_dedupe_inflight_is_per_event_loop(self):
+        """Test a search left running on one loop is never joined from another."""
+        import asyncio
+        from company_researcher import search_cache
+
+        async def search():
+            await asyncio.sleep(0)
+            return "results"
+
+        async def start_and_abandon():
+            # Leave the shared task registered when the loop shuts down
+            asyncio.ensure_future(search_cache.dedupe_inflight(["acme"], 3, search))
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+        first_loop = asyncio.new_event_loop()
+        try:
+            first_loop.run_until_complete(start_and_abandon())
+        finally:
+            first_loop.close()
+
+        result = asyncio.run(search_cache.dedupe_inflight(["acme"], 3, search))
+
+        assert result == "results"
+
 
 class TestCompanyResearcherGraph:
     """Tests for company_researcher graph structure."""
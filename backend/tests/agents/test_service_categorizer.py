@@ -22,6 +22,22 @@ class TestServiceCategorizerNodes:
         
         assert "company_profile" in result
         assert result["company_profile"]["company_name"] == "TechPlatform Inc"
+        assert json.loads(result["company_profile_json"]) == sample_company_profile
+
+    @pytest.mark.asyncio
+    async def test_extract_profile_prefers_profile_json_input(self, sample_company_profile):
+        """Test a profile passed as company_profile_json wins over the messages."""
+        from service_categorizer.graph import extract_profile
+        from langchain_core.messages import HumanMessage
+        
+        state = {
+            "messages": [HumanMessage(content='{"company_name": "Stale Corp"}')],
+            "company_profile_json": json.dumps(sample_company_profile),
+        }
+        
+        result = await extract_profile(state)
+        
+        assert result["company_profile"] == sample_company_profile
 
     @pytest.mark.asyncio
     async def test_extract_profile_handles_invalid_json(self):
@@ -86,6 +102,137 @@ class TestServiceCategorizerNodes:
         
         assert len(result["obligations"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_classify_service_warms_downstream_during_llm_call(self, sample_company_profile, sample_classification):
+        """Test downstream warm-up runs while the classification call is in flight."""
+        import asyncio
+        import threading
+        from service_categorizer import graph
+        
+        warmed = threading.Event()
+        
+        async def fake_ainvoke(messages):
+            # Resolves only if the warm-up ran concurrently with this call
+            while not warmed.is_set():
+                await asyncio.sleep(0.001)
+            response = MagicMock()
+            response.content = json.dumps(sample_classification)
+            return response
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = fake_ainvoke
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None), \
+             patch.object(graph, "_warm_downstream", side_effect=warmed.set):
+            result = await asyncio.wait_for(
+                graph.classify_service({"company_profile": sample_company_profile}), timeout=5
+            )
+        
+        assert result["classification"] == sample_classification
+
+    @pytest.mark.asyncio
+    async def test_classify_service_serves_cached_response(self, sample_company_profile, sample_classification):
+        """Test a cached classification skips the LLM call."""
+        from service_categorizer.graph import classify_service
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock()
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch("service_categorizer.graph.CLASSIFY_CACHE", True), \
+             patch("service_categorizer.graph.get_cached_response", return_value=json.dumps(sample_classification)), \
+             patch("service_categorizer.graph.set_cached_response") as set_cached:
+            result = await classify_service({"company_profile": sample_company_profile})
+        
+        mock_model.ainvoke.assert_not_called()
+        set_cached.assert_not_called()
+        assert result["classification"] == sample_classification
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test_classify_service_cache_is_opt_in(self, sample_company_profile, sample_classification, enabled):
+        """Test classifications are only read from and written to the cache when CLASSIFY_CACHE is on."""
+        from service_categorizer.graph import classify_service
+        
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(sample_classification)
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(return_value=mock_response)
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch("service_categorizer.graph.CLASSIFY_CACHE", enabled), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None) as get_cached, \
+             patch("service_categorizer.graph.set_cached_response") as set_cached:
+            await classify_service({"company_profile": sample_company_profile})
+        
+        assert get_cached.called is enabled
+        assert set_cached.called is enabled
+
+    @pytest.mark.asyncio
+    async def test_classify_service_does_not_cache_unparseable_response(self, sample_company_profile):
+        """Test responses that fail to parse are not written to the cache."""
+        from service_categorizer.graph import classify_service
+        
+        mock_response = MagicMock()
+        mock_response.content = "I cannot answer that."
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(return_value=mock_response)
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch("service_categorizer.graph.CLASSIFY_CACHE", True), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None), \
+             patch("service_categorizer.graph.set_cached_response") as set_cached:
+            result = await classify_service({"company_profile": sample_company_profile})
+        
+        set_cached.assert_not_called()
+        assert result["classification"]["summary"] == "I cannot answer that."
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content, in_scope", [
+        # Cut off in the trailing summary: every decision field arrived
+        ('{"territorial_scope": {"is_in_scope": true}, "service_classification": '
+         '{"service_category": "Hosting", "is_online_platform": true, "is_marketplace": false, '
+         '"is_search_engine": false}, "size_designation": {"is_vlop_vlose": false, '
+         '"qualifies_for_sme_exemption": false}, "summary": "A hosting serv', True),
+        # Cut off before the platform flags: falls back to the parse-error result
+        ('{"territorial_scope": {"is_in_scope": true, "reasoning": "EU establish', False),
+    ])
+    async def test_classify_service_does_not_cache_truncated_response(
+        self, sample_company_profile, caplog, content, in_scope
+    ):
+        """Test truncated classifications are never cached and only used when complete."""
+        from service_categorizer.graph import classify_service
+        
+        mock_response = MagicMock()
+        mock_response.content = content
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(return_value=mock_response)
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch("service_categorizer.graph.CLASSIFY_CACHE", True), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None), \
+             patch("service_categorizer.graph.set_cached_response") as set_cached:
+            result = await classify_service({"company_profile": sample_company_profile})
+        
+        set_cached.assert_not_called()
+        assert result["classification"]["territorial_scope"]["is_in_scope"] is in_scope
+        assert bool(result["obligations"]) is in_scope
+        assert "truncated" in caplog.text
+
+    def test_get_cached_response_decodes_bytes(self):
+        """Test cached completions come back as str from the bytes-mode Redis client."""
+        from service_categorizer import cache
+
+        client = MagicMock()
+        client.get.return_value = b'{"summary": "ok"}'
+
+        with patch.object(cache, "_get_redis_client", return_value=client):
+            assert cache.get_cached_response("model", "prompt") == '{"summary": "ok"}'
+
     @pytest.mark.asyncio
     async def test_analyze_obligations_no_obligations(self, sample_company_profile):
         """Test analyze_obligations handles empty obligations."""
@@ -101,16 +248,300 @@ class TestServiceCategorizerNodes:
         
         assert result["obligation_analyses"] == []
 
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_bounds_concurrency_and_keeps_order(self, sample_company_profile):
+        """Test analyze_obligations caps in-flight calls and preserves obligation order."""
+        import asyncio
+        from service_categorizer import graph
+        
+        running = 0
+        peak = 0
+        
+        async def fake_ainvoke(messages):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            article = messages[0].content.split("ARTICLE-", 1)[1].split()[0]
+            # Later obligations finish first
+            await asyncio.sleep(0.001 * (10 - int(article)))
+            running -= 1
+            response = MagicMock()
+            response.content = json.dumps({"article": article})
+            return response
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = fake_ainvoke
+        obligations = [{"article": f"ARTICLE-{i}", "title": f"Obligation {i}"} for i in range(8)]
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_CONCURRENCY", 3), \
+             patch.object(graph, "OBLIGATION_MAX_CONCURRENCY", 3), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": obligations,
+            })
+        
+        assert peak == 3
+        assert [a["article"] for a in result["obligation_analyses"]] == [str(i) for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_retries_rate_limited_calls(self, sample_company_profile):
+        """Test a throttled obligation call is retried and the limit is halved."""
+        import openai
+        from service_categorizer import graph
+        
+        rate_limited = openai.RateLimitError(
+            "slow down", response=MagicMock(status_code=429), body=None
+        )
+        ok = MagicMock()
+        ok.content = json.dumps({"article": "11", "applies": True})
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(side_effect=[rate_limited, ok])
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_CONCURRENCY", 4), \
+             patch.object(graph, "OBLIGATION_RETRY_BACKOFF", 0), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": [{"article": "11", "title": "Points of contact"}],
+            })
+            learned = dict(graph._LEARNED_LIMITS)
+        
+        assert mock_model.ainvoke.call_count == 2
+        assert result["obligation_analyses"] == [{"article": "11", "applies": True}]
+        assert list(learned.values()) == [2]
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_times_out_hung_calls(self, sample_company_profile):
+        """Test a hung call is abandoned after the timeout and reported as failed."""
+        import asyncio
+        from service_categorizer import graph
+        
+        calls = []
+        
+        async def hang(messages):
+            calls.append(1)
+            await asyncio.sleep(10)
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = hang
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_TIMEOUT", 0.01), \
+             patch.object(graph, "OBLIGATION_RETRY_BACKOFF", 0), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await asyncio.wait_for(graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": [{"article": "11", "title": "Points of contact"}],
+            }), timeout=5)
+        
+        [analysis] = result["obligation_analyses"]
+        assert analysis["implications"] == "Analysis failed: TimeoutError"
+        # A timeout is not retried, so the tail is capped at one timeout
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_dedupes_identical_obligations(self, sample_company_profile):
+        """Test duplicate obligations share one LLM call but keep their slots."""
+        from service_categorizer import graph
+        
+        response = MagicMock()
+        response.content = json.dumps({"article": "16", "applies": True})
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(return_value=response)
+        duplicate = {"article": 16, "title": "Notice and action"}
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": [duplicate, dict(duplicate)],
+            })
+        
+        assert mock_model.ainvoke.call_count == 1
+        assert len(result["obligation_analyses"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_batches_groups(self, sample_company_profile):
+        """Test batch mode sends one call per group and flattens the analyses."""
+        from service_categorizer import graph
+        
+        def analysis(article):
+            return {"article": article, "title": f"T{article}", "applies": True,
+                    "implications": "...", "action_items": []}
+        
+        async def fake_ainvoke(messages):
+            prompt = messages[0].content
+            articles = [a for a in ("11", "12", "13") if f"Article {a}\n" in prompt]
+            response = MagicMock()
+            if '"analyses"' in prompt:
+                response.content = json.dumps({"analyses": [analysis(a) for a in articles]})
+            else:
+                response.content = json.dumps(analysis(articles[0]))
+            return response
+        
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+        obligations = [{"article": a, "title": f"T{a}"} for a in ("11", "12", "13")]
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_BATCH_SIZE", 2), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": obligations,
+            })
+        
+        assert mock_model.ainvoke.call_count == 2
+        assert [a["article"] for a in result["obligation_analyses"]] == ["11", "12", "13"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_batch_falls_back_to_single_calls(self, sample_company_profile):
+        """Test a batch answer with missing entries is redone one obligation at a time."""
+        from service_categorizer import graph
+        
+        def reply(payload):
+            response = MagicMock()
+            response.content = json.dumps(payload)
+            return response
+        
+        truncated = reply({"analyses": [{"article": "11", "title": "T11", "applies": True,
+                                         "implications": "...", "action_items": []}]})
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(side_effect=[
+            truncated, reply({"article": "11"}), reply({"article": "12"}),
+        ])
+        obligations = [{"article": a, "title": f"T{a}"} for a in ("11", "12")]
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_BATCH_SIZE", 2), \
+             patch.object(graph, "OBLIGATION_CONCURRENCY", 1), \
+             patch.object(graph, "OBLIGATION_MAX_CONCURRENCY", 1), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": obligations,
+            })
+        
+        assert mock_model.ainvoke.call_count == 3
+        assert result["obligation_analyses"] == [{"article": "11"}, {"article": "12"}]
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_batch_with_repeated_entry_falls_back(self, sample_company_profile):
+        """Test a batch that repeats one obligation and skips another is redone singly."""
+        from service_categorizer import graph
+        
+        def reply(payload):
+            response = MagicMock()
+            response.content = json.dumps(payload)
+            return response
+        
+        entry = {"article": "11", "title": "T11", "applies": True, "implications": "...", "action_items": []}
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(side_effect=[
+            reply({"analyses": [entry, entry]}), reply({"article": "11"}), reply({"article": "12"}),
+        ])
+        obligations = [{"article": a, "title": f"T{a}"} for a in ("11", "12")]
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_BATCH_SIZE", 2), \
+             patch.object(graph, "OBLIGATION_CONCURRENCY", 1), \
+             patch.object(graph, "OBLIGATION_MAX_CONCURRENCY", 1), \
+             patch.object(graph, "OBLIGATION_CACHE", True), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None), \
+             patch("service_categorizer.graph.set_cached_response") as set_cached, \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": obligations,
+            })
+        
+        assert mock_model.ainvoke.call_count == 3
+        assert result["obligation_analyses"] == [{"article": "11"}, {"article": "12"}]
+        # Only the two single-obligation answers are cached, never the bad batch
+        assert set_cached.call_count == 2
+        assert all('"analyses"' not in call.args[2] for call in set_cached.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_rejects_incomplete_truncated_analysis(self, sample_company_profile):
+        """Test a truncated analysis missing required fields becomes a failure entry."""
+        from service_categorizer import graph
+        
+        truncated = MagicMock()
+        truncated.content = '{"article": "11", "title": "T11", "applies": true, "implications": "Must app'
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(return_value=truncated)
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": [{"article": "11", "title": "T11"}],
+            })
+        
+        [analysis] = result["obligation_analyses"]
+        assert analysis["implications"].startswith("Analysis failed")
+        assert analysis["action_items"] == ["Review this article manually"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_obligations_throttled_batch_is_not_split(self, sample_company_profile):
+        """Test a batch that stays rate limited is reported as failed, not retried per obligation."""
+        import openai
+        from service_categorizer import graph
+        
+        rate_limited = openai.RateLimitError(
+            "slow down", response=MagicMock(status_code=429), body=None
+        )
+        mock_model = MagicMock()
+        mock_model.ainvoke = AsyncMock(side_effect=rate_limited)
+        obligations = [{"article": a, "title": f"T{a}"} for a in ("11", "12")]
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "OBLIGATION_BATCH_SIZE", 2), \
+             patch.object(graph, "OBLIGATION_RETRY_BACKOFF", 0), \
+             patch.dict(graph._LEARNED_LIMITS, clear=True), \
+             patch.object(graph, "_get_dsa_legal_text", return_value=None):
+            result = await graph.analyze_obligations({
+                "company_profile": sample_company_profile,
+                "classification": {},
+                "obligations": obligations,
+            })
+        
+        assert mock_model.ainvoke.call_count == graph.OBLIGATION_MAX_ATTEMPTS
+        analyses = result["obligation_analyses"]
+        assert [a["article"] for a in analyses] == ["11", "12"]
+        assert all(a["implications"].startswith("Analysis failed") for a in analyses)
+
     @pytest.mark.asyncio
     async def test_generate_report_creates_json(self, sample_company_profile, sample_classification):
         """Test generate_report creates valid JSON."""
         from service_categorizer.graph import generate_report
         
-        mock_response = MagicMock()
-        mock_response.content = "Summary of compliance requirements."
+        async def fake_astream(messages):
+            for token in ("Summary of ", "compliance ", "requirements."):
+                chunk = MagicMock()
+                chunk.content = token
+                yield chunk
         
         mock_model = MagicMock()
-        mock_model.ainvoke = AsyncMock(return_value=mock_response)
+        mock_model.astream = fake_astream
         
         with patch("service_categorizer.graph._get_model", return_value=mock_model):
             state = {
@@ -123,6 +554,39 @@ class TestServiceCategorizerNodes:
         assert "final_report" in result
         parsed = json.loads(result["final_report"])
         assert parsed["company_name"] == "TechPlatform Inc"
+        assert parsed["summary"] == "Summary of compliance requirements."
+        assert result["report"] == parsed
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled, tokens, cached", [
+        (False, ["Summary."], False),
+        (True, ["Summary."], True),
+        (True, ["", "  "], False),
+    ])
+    async def test_generate_report_caches_only_enabled_non_empty_summaries(
+        self, sample_company_profile, enabled, tokens, cached
+    ):
+        """Test summaries are cached only when REPORT_CACHE is on and they have content."""
+        from service_categorizer import graph
+        
+        async def fake_astream(messages):
+            for token in tokens:
+                chunk = MagicMock()
+                chunk.content = token
+                yield chunk
+        
+        mock_model = MagicMock()
+        mock_model.astream = fake_astream
+        
+        with patch("service_categorizer.graph._get_model", return_value=mock_model), \
+             patch.object(graph, "REPORT_CACHE", enabled), \
+             patch("service_categorizer.graph.get_cached_response", return_value=None) as get_cached, \
+             patch("service_categorizer.graph.set_cached_response") as set_cached:
+            await graph.generate_report({"company_profile": sample_company_profile})
+        
+        assert get_cached.called == enabled
+        assert set_cached.called == cached
 
 
 class TestServiceCategorizerUtils:
@@ -140,6 +604,41 @@ class TestServiceCategorizerUtils:
         result = _parse_json(text)
         assert result == {"is_in_scope": True}
 
+    def test_get_dsa_legal_text_extracts_point_once_per_ref(self):
+        """Test article lookups are memoized and points are extracted from the body."""
+        from service_categorizer import graph
+
+        chunk = MagicMock()
+        chunk.title = "Notice and action mechanisms"
+        chunk.content = "1. First point.\n2. Second point\nspans lines.\n3. Third point."
+        get_article = MagicMock(return_value=chunk)
+
+        graph._lookup_dsa_legal_text.cache_clear()
+        with patch.object(graph, "_get_dsa_article", get_article):
+            first = graph._get_dsa_legal_text("16.2")
+            first["point_content"] = "mutated"
+            second = graph._get_dsa_legal_text("16.2")
+        graph._lookup_dsa_legal_text.cache_clear()
+
+        get_article.assert_called_once_with("16")
+        assert second["point_number"] == "2"
+        assert second["point_content"] == "2. Second point\nspans lines."
+
+    def test_render_obligation_prompt_is_memoized(self):
+        """Test identical obligation prompt inputs are rendered once."""
+        from service_categorizer import graph
+
+        args = ('{"article":11,"title":"Points of contact"}', "{}", "Acme", "In scope.", None)
+        graph._render_obligation_prompt.cache_clear()
+        with patch.object(graph, "_get_dsa_legal_text", return_value=None) as legal_text:
+            first = graph._render_obligation_prompt(*args)
+            second = graph._render_obligation_prompt(*args)
+        graph._render_obligation_prompt.cache_clear()
+
+        assert first is second
+        assert "Article 11" in first
+        legal_text.assert_called_once_with(11)
+
     def test_get_model_returns_chatgpt(self):
         """Test _get_model returns ChatOpenAI instance."""
         from service_categorizer.graph import _get_model
@@ -148,6 +647,38 @@ class TestServiceCategorizerUtils:
             model = _get_model()
             assert model is not None
 
+    def test_get_model_reuses_client_per_endpoint(self):
+        """Test _get_model shares one client per (api_key, base_url)."""
+        from service_categorizer.graph import _get_model
+
+        config = {"configurable": {"apiKeys": {"OPENAI_API_KEY": "k1", "OPENAI_BASE_URL": "http://a"}}}
+        other = {"configurable": {"apiKeys": {"OPENAI_API_KEY": "k2", "OPENAI_BASE_URL": "http://a"}}}
+
+        assert _get_model(config) is _get_model(config)
+        assert _get_model(config) is not _get_model(other)
+
+    def test_prompts_keep_company_data_after_static_prefix(self):
+        """Test company-specific data only appears after the shared prompt prefix."""
+        from service_categorizer.graph import load_prompt
+
+        obligation = {"article": "16", "title": "Notice and action", "context": "ctx", "key_requirements": ["r1"]}
+        renders = {
+            name: load_prompt(
+                "obligation.jinja",
+                company_name=name,
+                company_profile=f'{{"company_name": "{name}"}}',
+                obligation=obligation,
+                classification_summary=f"{name} is a hosting service.",
+            )
+            for name in ("Acme", "Globex")
+        }
+        prefix = renders["Acme"].split("## Company: Acme", 1)[0]
+        assert renders["Globex"].startswith(prefix)
+        assert "Respond with valid JSON only" in prefix
+
+        classify = load_prompt("classify.jinja", company_profile='{"company_name": "Acme"}', top_domain="acme.com")
+        assert classify.index("acme.com") > classify.index("Respond with valid JSON only")
+
 
 class TestServiceCategorizerGraph:
     """Tests for service_categorizer graph structure."""
@@ -0,0 +1,584 @@
+"""Tests for admin API endpoints."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture(autouse=True)
+def clear_admin_caches():
+    """Each test computes stats and reports from its own database."""
+    from api import admin
+
+    admin._stats_cache.clear()
+    admin._stats_inflight.clear()
+    admin._pdf_cache.clear()
+    yield
+    admin._stats_cache.clear()
+    admin._pdf_cache.clear()
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with the tracking schema."""
+    from database import Base
+
+    # Shared single connection: endpoints may hop to worker threads.
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _request(**headers):
+    """Bare Starlette request carrying the given headers."""
+    from starlette.requests import Request
+
+    return Request({
+        "type": "http",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def _add_session(db, *, days_ago=0, **fields):
+    from database import Session
+
+    created_at = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    db.add(Session(created_at=created_at, **fields))
+    db.commit()
+
+
+class TestDashboardStats:
+    """Tests for /admin/stats aggregation."""
+
+    async def test_dashboard_stats_aggregates_window(self, db):
+        """Test aggregates cover only the window and average duration over completed sessions."""
+        from api.admin import get_dashboard_stats
+        from database.models import SessionStatus
+
+        _add_session(db, status=SessionStatus.COMPLETED, total_duration_seconds=10.0,
+                     total_llm_calls=3, total_search_calls=5, estimated_cost_usd=0.5)
+        _add_session(db, status=SessionStatus.COMPLETED, total_duration_seconds=20.0,
+                     total_llm_calls=1, total_search_calls=1, estimated_cost_usd=0.25)
+        _add_session(db, status=SessionStatus.ERROR, total_duration_seconds=100.0,
+                     total_llm_calls=2, total_search_calls=0, estimated_cost_usd=0.1)
+        # Outside the 7-day window
+        _add_session(db, days_ago=30, status=SessionStatus.COMPLETED, total_duration_seconds=500.0,
+                     total_llm_calls=50, total_search_calls=50, estimated_cost_usd=9.0)
+
+        stats = await get_dashboard_stats(Response(), admin="admin", db=db, days=7)
+
+        assert stats["total_sessions"] == 3
+        assert stats["completed_sessions"] == 2
+        assert stats["error_count"] == 1
+        assert stats["error_rate_percent"] == 33.3
+        assert stats["avg_duration_seconds"] == 15.0
+        assert stats["total_llm_calls"] == 6
+        assert stats["total_search_calls"] == 6
+        assert stats["estimated_cost_usd"] == 0.85
+
+    async def test_dashboard_stats_empty(self, db):
+        """Test an empty window reports zeros rather than None."""
+        from api.admin import get_dashboard_stats
+
+        stats = await get_dashboard_stats(Response(), admin="admin", db=db, days=7)
+
+        assert stats["total_sessions"] == 0
+        assert stats["avg_duration_seconds"] == 0
+        assert stats["total_llm_calls"] == 0
+        assert stats["estimated_cost_usd"] == 0
+        assert [d["count"] for d in stats["sessions_per_day"]] == [0] * 7
+
+    async def test_dashboard_stats_sessions_per_day(self, db):
+        """Test per-day counts come back oldest first with empty days zero-filled."""
+        from api.admin import get_dashboard_stats
+
+        _add_session(db)
+        _add_session(db)
+        _add_session(db, days_ago=2)
+        _add_session(db, days_ago=10)
+
+        stats = await get_dashboard_stats(Response(), admin="admin", db=db, days=3)
+
+        today = datetime.now(timezone.utc).date()
+        assert stats["sessions_per_day"] == [
+            {"date": (today - timedelta(days=2)).isoformat(), "count": 1},
+            {"date": (today - timedelta(days=1)).isoformat(), "count": 0},
+            {"date": today.isoformat(), "count": 2},
+        ]
+
+    async def test_dashboard_stats_cached_per_window(self, db):
+        """Test repeat requests within the TTL reuse the computed stats."""
+        from unittest.mock import patch
+        from api import admin
+
+        first = await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7)
+        _add_session(db)
+
+        assert await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7) is first
+        assert (await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=3))["total_sessions"] == 1
+
+        with patch("api.admin.time.monotonic", return_value=float("inf")):
+            assert (await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7))["total_sessions"] == 1
+
+
+    async def test_dashboard_stats_misses_share_one_compute_per_window(self, db):
+        """Test concurrent misses compute each window once without blocking other windows."""
+        import asyncio
+        import time
+        from unittest.mock import patch
+        from api import admin
+
+        computed = []
+        finished = []
+
+        def slow_compute(db, days):
+            computed.append(days)
+            time.sleep(0.05 if days == 7 else 0)
+            return {"days": days}
+
+        async def fetch(days):
+            stats = await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=days)
+            finished.append(days)
+            return stats
+
+        with patch.object(admin, "_compute_dashboard_stats", side_effect=slow_compute):
+            slow = [asyncio.ensure_future(fetch(7)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            assert await fetch(3) == {"days": 3}
+            results = await asyncio.gather(*slow)
+
+        assert sorted(computed) == [3, 7]
+        assert finished[0] == 3
+        assert results == [{"days": 7}] * 3
+        assert admin._stats_inflight == {}
+
+    async def test_dashboard_stats_compute_uses_its_own_session(self, db):
+        """Test the shared compute never runs on the requesting caller's session."""
+        from unittest.mock import patch
+        from api import admin
+
+        used = []
+
+        def compute(session, days):
+            used.append(session)
+            return {"days": days}
+
+        with patch.object(admin, "_compute_dashboard_stats", side_effect=compute):
+            await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7)
+
+        [session] = used
+        assert session is not db
+        assert session.get_bind() is db.get_bind()
+
+    async def test_dashboard_stats_compute_racing_invalidation_is_not_cached(self, db):
+        """Test stats computed across a deletion are returned but not stored."""
+        import asyncio
+        import threading
+        from unittest.mock import patch
+        from api import admin
+
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute(db, days):
+            calls.append(days)
+            if len(calls) == 1:
+                started.set()
+                release.wait(1)
+            return {"call": len(calls)}
+
+        with patch.object(admin, "_compute_dashboard_stats", side_effect=compute):
+            stale = asyncio.ensure_future(
+                admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7)
+            )
+            await asyncio.to_thread(started.wait, 1)
+            admin._invalidate_stats()
+            release.set()
+
+            assert await stale == {"call": 1}
+            assert await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=7) == {"call": 2}
+
+    async def test_dashboard_stats_cache_headers_and_invalidation(self, db):
+        """Test stats advertise their TTL and admin deletions drop the cached copy."""
+        from api import admin
+
+        _add_session(db, days_ago=1)
+        _add_session(db, days_ago=40)
+        response = Response()
+
+        assert (await admin.get_dashboard_stats(response, admin="admin", db=db, days=90))["total_sessions"] == 2
+        assert response.headers["Cache-Control"] == f"private, max-age={int(admin.STATS_CACHE_TTL)}"
+
+        await admin.cleanup_old_sessions(admin="admin", db=db, days=30)
+
+        assert (await admin.get_dashboard_stats(Response(), admin="admin", db=db, days=90))["total_sessions"] == 1
+
+
+class TestSessionDetail:
+    """Tests for single-session admin endpoints."""
+
+    @staticmethod
+    def _seed(db, steps=3, messages=3):
+        from database import ChatMessage, Session, SessionStep
+        from database.models import SessionStatus, StepType
+
+        now = datetime.now(timezone.utc)
+        session = Session(id="s1", created_at=now, status=SessionStatus.COMPLETED)
+        for i in range(steps):
+            session.steps.append(SessionStep(
+                step_type=StepType.COMPANY_RESEARCHER,
+                created_at=now + timedelta(seconds=i),
+                completed_at=now + timedelta(seconds=i, milliseconds=500),
+            ))
+        for i in range(messages):
+            session.chat_messages.append(ChatMessage(
+                role="user", content=f"m{i}", created_at=now + timedelta(seconds=10 + i),
+            ))
+        db.add(session)
+        db.commit()
+        db.expunge_all()
+
+    @staticmethod
+    def _record_queries(db):
+        from sqlalchemy import event
+
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        return statements
+
+    async def test_timeline_merges_events_in_time_order(self, db):
+        """Test the timeline interleaves steps and messages by timestamp."""
+        from api.admin import get_session_timeline
+        from database import SessionStep
+        from database.models import StepType
+
+        self._seed(db)
+        # A step that finishes after the chat messages, and one still running
+        start = db.query(SessionStep.created_at).order_by(SessionStep.created_at).first()[0]
+        db.add(SessionStep(session_id="s1", step_type=StepType.MAIN_AGENT,
+                           created_at=start + timedelta(seconds=5), completed_at=start + timedelta(seconds=20)))
+        db.add(SessionStep(session_id="s1", step_type=StepType.MAIN_AGENT, created_at=start + timedelta(seconds=6)))
+        db.commit()
+        db.expunge_all()
+        statements = self._record_queries(db)
+
+        result = json.loads((await get_session_timeline("s1", _request(), admin="admin", db=db)).body)
+
+        # session + steps + chat messages
+        assert len(statements) == 3
+        timestamps = [event["timestamp"] for event in result["timeline"]]
+        assert timestamps == sorted(timestamps)
+        types = [event["type"] for event in result["timeline"]]
+        assert types[0] == "session_start"
+        assert types[-1] == "step_main_agent_complete"
+        assert types.count("chat_user") == 3
+        assert len(types) == 1 + 3 * 2 + 3 + 2 + 1
+
+    async def test_timeline_keeps_listing_order_for_equal_timestamps(self, db):
+        """Test events sharing a timestamp keep the historical listing order."""
+        from api.admin import get_session_timeline
+        from database import ChatMessage, Session, SessionStep
+        from database.models import StepType
+
+        now = datetime.now(timezone.utc)
+        session = Session(id="s1", created_at=now, completed_at=now)
+        for step_type in (StepType.COMPANY_MATCHER, StepType.COMPANY_RESEARCHER):
+            session.steps.append(SessionStep(step_type=step_type, created_at=now, completed_at=now))
+        session.chat_messages.append(ChatMessage(role="user", content="hi", created_at=now))
+        db.add(session)
+        db.commit()
+        db.expunge_all()
+
+        result = json.loads((await get_session_timeline("s1", _request(), admin="admin", db=db)).body)
+
+        assert [event["type"] for event in result["timeline"]] == [
+            "session_start",
+            "step_company_matcher",
+            "step_company_matcher_complete",
+            "step_company_researcher",
+            "step_company_researcher_complete",
+            "chat_user",
+            "session_complete",
+        ]
+
+    async def test_session_detail_includes_history(self, db):
+        """Test session detail returns steps and chat messages."""
+        from api.admin import get_session
+
+        self._seed(db, steps=2, messages=1)
+
+        detail = json.loads((await get_session("s1", _request(), admin="admin", db=db)).body)
+
+        assert detail["steps_count"] == 2
+        assert len(detail["steps"]) == 2
+        assert [m["content"] for m in detail["chat_messages"]] == ["m0"]
+
+    async def test_session_detail_and_timeline_honor_if_none_match(self, db):
+        """Test unchanged JSON payloads answer 304 for a matching ETag."""
+        from api.admin import get_session, get_session_timeline
+
+        self._seed(db, steps=1, messages=1)
+
+        for endpoint in (get_session, get_session_timeline):
+            first = await endpoint("s1", _request(), admin="admin", db=db)
+            etag = first.headers["etag"]
+
+            cached = await endpoint("s1", _request(if_none_match=etag), admin="admin", db=db)
+            assert cached.status_code == 304
+            assert cached.body == b""
+
+            stale = await endpoint("s1", _request(if_none_match='"other"'), admin="admin", db=db)
+            assert stale.status_code == 200
+            assert stale.body == first.body
+
+    @pytest.mark.asyncio
+    async def test_export_pdf_skips_render_for_matching_etag(self, db):
+        """Test the PDF ETag follows updated_at and short-circuits the build."""
+        from unittest.mock import patch
+        from api.admin import export_session_pdf
+        from database import Session
+
+        self._seed(db, steps=0, messages=0)
+
+        first = await export_session_pdf("s1", _request(), admin="admin", db=db)
+        assert first.media_type == "application/pdf"
+        etag = first.headers["etag"]
+
+        with patch("reportlab.platypus.SimpleDocTemplate") as doc_cls:
+            cached = await export_session_pdf("s1", _request(if_none_match=f"W/{etag}"), admin="admin", db=db)
+        assert cached.status_code == 304
+        doc_cls.assert_not_called()
+
+        session = db.get(Session, "s1")
+        session.company_name = "Renamed"
+        db.commit()
+
+        changed = await export_session_pdf("s1", _request(if_none_match=etag), admin="admin", db=db)
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_export_pdf_reuses_rendered_bytes(self, db):
+        """Test re-exporting an unchanged session serves the cached PDF."""
+        from unittest.mock import patch
+        from api import admin
+        from database import Session
+
+        self._seed(db, steps=0, messages=0)
+
+        first = await admin.export_session_pdf("s1", _request(), admin="admin", db=db)
+        with patch.object(admin, "_render_session_pdf") as render:
+            again = await admin.export_session_pdf("s1", _request(), admin="admin", db=db)
+        render.assert_not_called()
+        assert again.body == first.body
+
+        session = db.get(Session, "s1")
+        session.compliance_report = {"summary": "Updated"}
+        db.commit()
+
+        with patch.object(admin, "_render_session_pdf", return_value=b"%PDF-new") as render:
+            changed = await admin.export_session_pdf("s1", _request(), admin="admin", db=db)
+        render.assert_called_once()
+        assert changed.body == b"%PDF-new"
+
+    @pytest.mark.asyncio
+    async def test_export_pdf_renders_on_bounded_workers(self, db):
+        """Test concurrent exports never run more renders than the PDF limiter allows."""
+        import asyncio
+        import threading
+        import time
+        from unittest.mock import patch
+        from api import admin
+        from database import Session
+
+        for i in range(5):
+            db.add(Session(id=f"r{i}"))
+        db.commit()
+
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_render(session):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return b"%PDF-" + session.id.encode()
+
+        with patch.object(admin, "_render_session_pdf", side_effect=slow_render):
+            # Each call gets its own DB session, as FastAPI's get_db would provide.
+            make_db = sessionmaker(bind=db.get_bind())
+            responses = await asyncio.gather(*(
+                admin.export_session_pdf(f"r{i}", _request(), admin="admin", db=make_db())
+                for i in range(5)
+            ))
+
+        assert peak == admin.PDF_RENDER_CONCURRENCY
+        assert [r.body for r in responses] == [f"%PDF-r{i}".encode() for i in range(5)]
+
+    async def test_admin_db_work_runs_on_bounded_limiter(self, db):
+        """Test concurrent admin requests never exceed the admin DB worker budget."""
+        import asyncio
+        import threading
+        import time
+        import anyio
+        from unittest.mock import patch
+        from api import admin
+
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_list(*args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return {"sessions": []}
+
+        with patch.object(admin, "_list_sessions", side_effect=slow_list), \
+             patch.object(admin, "_db_limiter", anyio.CapacityLimiter(2)):
+            await asyncio.gather(*(
+                admin.list_sessions(
+                    admin="admin", db=db, page=1, page_size=20, status=None, company=None, days=None, cursor=None
+                )
+                for _ in range(5)
+            ))
+
+        assert peak == 2
+
+    def test_render_pdf_builds_styles_once(self):
+        """Test reports with and without a classification share one style set."""
+        from api import admin
+        from database import Session
+
+        admin._pdf_styles.cache_clear()
+        report = {
+            "classification": {"service_classification": {"service_category": "Hosting"}},
+            "obligations": [{"article": "11", "title": "Points of contact", "applies": True}],
+        }
+
+        for session in (
+            Session(id="a", company_name="Acme", compliance_report=report),
+            Session(id="b", service_category="Hosting"),
+        ):
+            assert admin._render_session_pdf(session).startswith(b"%PDF-")
+
+        assert admin._pdf_styles.cache_info().misses == 1
+
+    async def test_list_sessions_loads_counts_per_page(self, db):
+        """Test listing a page does not lazy-load relationships per session."""
+        from api.admin import list_sessions
+        from database import Session
+
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            db.add(Session(id=f"p{i}", created_at=now - timedelta(minutes=i)))
+        db.commit()
+        self._seed(db, steps=2, messages=1)
+        statements = self._record_queries(db)
+
+        result = await list_sessions(
+            admin="admin", db=db, page=1, page_size=20, status=None, company=None, days=None, cursor=None
+        )
+
+        # count + page + steps + chat messages, independent of page size
+        assert len(statements) == 4
+        counts = {s["id"]: (s["steps_count"], s["chat_messages_count"]) for s in result["sessions"]}
+        assert counts["s1"] == (2, 1)
+        assert counts["p0"] == (0, 0)
+
+    async def test_list_sessions_skips_report_columns(self, db):
+        """Test the list query never selects the large JSON report columns."""
+        from api.admin import list_sessions
+        from database import Session
+
+        db.add(Session(id="p0", company_name="Acme", compliance_report={"obligations": []}))
+        db.commit()
+        db.expunge_all()
+        statements = self._record_queries(db)
+
+        result = await list_sessions(
+            admin="admin", db=db, page=1, page_size=20, status=None, company=None, days=None, cursor=None
+        )
+
+        assert not any("compliance_report" in s or "research_summary" in s for s in statements)
+        assert not any("response_data" in s or "content" in s for s in statements)
+        session = result["sessions"][0]
+        assert session["company_name"] == "Acme"
+        assert "compliance_report" not in session
+
+    async def test_list_sessions_keyset_cursor(self, db):
+        """Test cursor pages walk every session once and skip the COUNT query."""
+        from fastapi import HTTPException
+        from api.admin import list_sessions
+        from database import Session
+
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            # Two sessions share each timestamp so the id tiebreaker matters
+            db.add(Session(id=f"p{i}", created_at=now - timedelta(minutes=i // 2)))
+        db.commit()
+
+        async def page(cursor):
+            return await list_sessions(
+                admin="admin", db=db, page=1, page_size=2, status=None, company=None, days=None, cursor=cursor
+            )
+
+        first = await page(None)
+        assert first["total"] == 5 and first["has_more"]
+
+        seen = [s["id"] for s in first["sessions"]]
+        cursor = first["next_cursor"]
+        statements = self._record_queries(db)
+        while cursor:
+            result = await page(cursor)
+            assert "total" not in result
+            seen += [s["id"] for s in result["sessions"]]
+            cursor = result["next_cursor"]
+
+        assert seen == ["p1", "p0", "p3", "p2", "p4"]
+        assert not any("count(" in s.lower() for s in statements)
+
+        with pytest.raises(HTTPException) as exc:
+            await page("not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+class TestCleanup:
+    """Tests for bulk session cleanup."""
+
+    async def test_cleanup_old_sessions_deletes_in_one_statement(self, db):
+        """Test cleanup reports the deleted count from a single DELETE."""
+        from api.admin import cleanup_old_sessions
+        from database import Session
+
+        _add_session(db, days_ago=40)
+        _add_session(db, days_ago=35)
+        _add_session(db, days_ago=1)
+        statements = TestSessionDetail._record_queries(db)
+
+        result = await cleanup_old_sessions(admin="admin", db=db, days=30)
+
+        assert result["deleted_count"] == 2
+        queries = [s for s in statements if s.startswith(("SELECT", "DELETE"))]
+        assert len(queries) == 1 and queries[0].startswith("DELETE")
+        assert db.query(Session).count() == 1
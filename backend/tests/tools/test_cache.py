@@ -5,6 +5,16 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    """Start every test with an empty in-process cache tier."""
+    import tools.cache
+
+    tools.cache._local.clear()
+    yield
+    tools.cache._local.clear()
+
+
 class TestRedisCache:
     """Tests for Redis cache functions."""
 
@@ -150,6 +160,80 @@ class TestRedisCache:
             # Client should be reset
             assert tools.cache._client is None
 
+    def test_get_cached_many_uses_single_mget(self, mock_redis_client):
+        """Test get_cached_many fetches all keys in one MGET, keeping order."""
+        import tools.cache
+        
+        cached_data = {"results": [{"title": "Test"}]}
+        mock_redis_client.mget.return_value = [None, json.dumps(cached_data).encode(), b"invalid json {"]
+        
+        with patch.object(tools.cache, "get_redis_client", return_value=mock_redis_client):
+            result = tools.cache.get_cached_many(["a", "b", "c"], 10)
+        
+        assert result == [None, cached_data, None]
+        mock_redis_client.mget.assert_called_once()
+        keys = mock_redis_client.mget.call_args[0][0]
+        assert keys == [tools.cache.make_cache_key(q, 10) for q in ("a", "b", "c")]
+        mock_redis_client.get.assert_not_called()
+
+    def test_set_cached_many_pipelines_writes(self, mock_redis_client):
+        """Test set_cached_many writes every response through one pipeline."""
+        import tools.cache
+        
+        pipe = mock_redis_client.pipeline.return_value
+        
+        with patch.object(tools.cache, "get_redis_client", return_value=mock_redis_client):
+            tools.cache.set_cached_many([("a", {"n": 1}), ("b", {"n": 2})], 10)
+        
+        assert pipe.setex.call_count == 2
+        key, ttl, data = pipe.setex.call_args_list[1][0]
+        assert (key, ttl) == (tools.cache.make_cache_key("b", 10), tools.cache.CACHE_TTL)
+        assert json.loads(data) == {"n": 2}
+        pipe.execute.assert_called_once()
+        mock_redis_client.setex.assert_not_called()
+
+    def test_get_cached_serves_repeats_from_local_cache(self, mock_redis_client):
+        """Test a Redis hit is kept in-process so the next lookup skips Redis."""
+        import tools.cache
+        
+        cached_data = {"results": [{"title": "Test"}]}
+        mock_redis_client.get.return_value = json.dumps(cached_data).encode()
+        
+        with patch.object(tools.cache, "get_redis_client", return_value=mock_redis_client):
+            first = tools.cache.get_cached("test query", 10)
+            second = tools.cache.get_cached("Test Query ", 10)
+            many = tools.cache.get_cached_many(["test query"], 10)
+        
+        assert first == second == cached_data
+        assert many == [cached_data]
+        mock_redis_client.get.assert_called_once()
+        mock_redis_client.mget.assert_not_called()
+
+    def test_set_cached_fills_local_cache_without_redis(self):
+        """Test written responses are served in-process even when Redis is down."""
+        import tools.cache
+        
+        with patch.object(tools.cache, "get_redis_client", return_value=None):
+            tools.cache.set_cached_many([("a", {"n": 1})], 10)
+            assert tools.cache.get_cached("a", 10) == {"n": 1}
+            assert tools.cache.get_cached("a", 5) is None
+
+    def test_local_cache_evicts_and_expires(self):
+        """Test the in-process tier drops least recently used and expired entries."""
+        import tools.cache
+        
+        local = tools.cache._LocalCache(maxsize=2, ttl=60)
+        local.set("a", {"n": 1})
+        local.set("b", {"n": 2})
+        local.get("a")
+        local.set("c", {"n": 3})
+        
+        assert local.get("b") is None
+        assert local.get("a") == {"n": 1}
+        
+        with patch("tools.cache.time.monotonic", return_value=float("inf")):
+            assert local.get("a") is None
+
     def test_cache_ttl_constant(self):
         """Test CACHE_TTL is 6 hours."""
         from tools.cache import CACHE_TTL
@@ -4,6 +4,20 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _all_misses(queries, max_results):
+    return [None] * len(queries)
+
+
+@pytest.fixture(autouse=True)
+def clear_tavily_clients():
+    """Drop shared Tavily clients so each test sees its own patched client."""
+    from tools import tavily_tools
+
+    tavily_tools._clients.clear()
+    yield
+    tavily_tools._clients.clear()
+
+
 class TestTavilyTools:
     """Tests for Tavily search functions."""
 
@@ -57,8 +71,8 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["acme corporation"])
         
         assert "Search Results:" in result
@@ -83,8 +97,8 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["test"])
         
         # Should only include unique URLs
@@ -101,8 +115,8 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["query 1", "query 2"])
         
         # Should have called search for each query
@@ -118,7 +132,7 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=mock_tavily_response):
+                with patch("tools.tavily_tools.get_cached_many", return_value=[mock_tavily_response]):
                     result = await tavily_search_tool(["cached query"])
         
         # Should not call API when cache hit
@@ -136,12 +150,72 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
                     result = await tavily_search_tool(["failing query"])
         
         # Should include error in results
         assert "Search failed" in result or "error" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_tavily_search_tool_retries_rate_limits(self, mock_tavily_response):
+        """Test tavily_search_tool retries a rate-limited search before giving up."""
+        from tenacity import wait_none
+        from tavily.errors import UsageLimitExceededError
+        import tools.tavily_tools as tavily_tools
+        
+        mock_client = AsyncMock()
+        mock_client.search = AsyncMock(
+            side_effect=[UsageLimitExceededError("slow down"), mock_tavily_response]
+        )
+        
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
+            with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
+                        with patch.object(tavily_tools._search.retry, "wait", wait_none()):
+                            result = await tavily_tools.tavily_search_tool(["acme corporation"])
+        
+        assert mock_client.search.call_count == 2
+        assert "Acme Corporation" in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, calls", [(404, 1), (422, 1), (408, 2), (503, 2)])
+    async def test_tavily_search_tool_retries_only_transient_http_errors(
+        self, mock_tavily_response, status, calls
+    ):
+        """Test unmapped HTTP errors are retried only for 5xx and 408."""
+        import httpx
+        from tenacity import wait_none
+        import tools.tavily_tools as tavily_tools
+        
+        request = httpx.Request("POST", "https://api.tavily.com/search")
+        error = httpx.HTTPStatusError(
+            "error", request=request, response=httpx.Response(status, request=request)
+        )
+        mock_client = AsyncMock()
+        mock_client.search = AsyncMock(side_effect=[error, mock_tavily_response])
+        
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
+            with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
+                        with patch.object(tavily_tools._search.retry, "wait", wait_none()):
+                            await tavily_tools.tavily_search_tool(["acme corporation"])
+        
+        assert mock_client.search.call_count == calls
+
+    def test_semaphore_is_created_per_event_loop(self):
+        """Test each event loop gets its own request cap."""
+        import asyncio
+        import tools.tavily_tools as tavily_tools
+        
+        async def get():
+            first = tavily_tools._get_semaphore()
+            assert tavily_tools._get_semaphore() is first
+            return first
+        
+        assert asyncio.run(get()) is not asyncio.run(get())
+
     @pytest.mark.asyncio
     async def test_tavily_search_tool_no_results(self):
         """Test tavily_search_tool handles empty results."""
@@ -154,8 +228,8 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["no results query"])
         
         assert "No search results found" in result
@@ -177,8 +251,8 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["test"])
         
         # Content should be truncated
@@ -201,14 +275,67 @@ class TestTavilyTools:
         
         with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
             with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
-                with patch("tools.tavily_tools.get_cached", return_value=None):
-                    with patch("tools.tavily_tools.set_cached"):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
                         result = await tavily_search_tool(["test"])
         
         # Should only show first 10 results
         assert "test10.com" not in result or "test14.com" not in result
 
+    @pytest.mark.asyncio
+    async def test_tavily_search_tool_reuses_client(self, mock_tavily_response):
+        """Test one Tavily client per API key is shared across calls."""
+        import tools.tavily_tools as tavily_tools
+
+        mock_client = AsyncMock()
+        mock_client.search = AsyncMock(return_value=mock_tavily_response)
+
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
+            with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client) as client_cls:
+                with patch("tools.tavily_tools.get_cached_many", side_effect=_all_misses):
+                    with patch("tools.tavily_tools.set_cached_many"):
+                        await tavily_tools.tavily_search_tool(["query 1"])
+                        await tavily_tools.tavily_search_tool(["query 2"])
+
+        assert client_cls.call_count == 1
+
+        await tavily_tools.close_clients()
+        mock_client.close.assert_awaited_once()
+        assert tavily_tools._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_tavily_search_tool_searches_misses_concurrently(self):
+        """Test uncached queries run in parallel and results keep query order."""
+        import asyncio
+        from tools.tavily_tools import tavily_search_tool
+
+        running = 0
+        peak = 0
+
+        async def fake_search(query, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if query == "bad":
+                raise Exception("API Error")
+            return {"results": [{"title": query, "url": f"https://{query}.com", "content": ""}]}
 
+        cached = {"results": [{"title": "hit", "url": "https://hit.com", "content": ""}]}
 
+        mock_client = AsyncMock()
+        mock_client.search = AsyncMock(side_effect=fake_search)
 
+        with patch.dict("os.environ", {"TAVILY_API_KEY": "test-key"}):
+            with patch("tools.tavily_tools.AsyncTavilyClient", return_value=mock_client):
+                with patch("tools.tavily_tools.get_cached_many", side_effect=lambda qs, n: [cached if q == "hit" else None for q in qs]):
+                    with patch("tools.tavily_tools.set_cached_many") as set_cached:
+                        result = await tavily_search_tool(["a", "hit", "bad", "b"])
 
+        assert peak == 3
+        assert mock_client.search.call_count == 3
+        stored, _ = set_cached.call_args.args
+        assert [query for query, _ in stored] == ["a", "b"]
+        positions = [result.index(s) for s in ("https://a.com", "https://hit.com", "Search failed for 'bad'", "https://b.com")]
+        assert positions == sorted(positions)
@@ -102,6 +102,15 @@ class TestCompanyMatcherModels:
         assert parsed["exact_match"]["name"] == "Acme Corporation"
         assert "suggestions" in parsed
 
+    def test_company_match_result_to_json_honors_indent(self):
+        """Test to_json uses the requested indentation and drops None fields."""
+        from company_matcher.models import CompanyMatchResult
+        
+        result = CompanyMatchResult(input_name="Acme Corp")
+        
+        assert result.to_json(indent=4).startswith('{\n    "input_name"')
+        assert "exact_match" not in result.to_json()
+
 
 class TestCompanyResearcherModels:
     """Tests for company_researcher models."""
@@ -195,3 +195,22 @@ class TestObligationLoader:
 
 
 
+
+    def test_get_obligations_for_classification_returns_fresh_list(self):
+        """Test memoized selections are handed out as independent lists."""
+        from service_categorizer.obligations import get_obligations_for_classification
+        
+        kwargs = dict(
+            service_category="Online Platform",
+            is_online_platform=True,
+            is_marketplace=False,
+            is_search_engine=False,
+            is_vlop_vlose=False,
+            is_sme_exemption_eligible=False,
+        )
+        first = get_obligations_for_classification(**kwargs)
+        expected = list(first)
+        first.clear()
+        
+        assert get_obligations_for_classification(**kwargs) == expected
+        assert len(expected) > 0
@@ -90,6 +90,16 @@ class TestCompanyMatcherUtils:
         result = _parse_result_from_messages([human, ai])
         assert '"name": "Real"' in result
 
+    def test_parse_result_from_messages_ignores_braces_in_leading_text(self):
+        """Test _parse_result_from_messages skips braces in chatter before the JSON."""
+        from company_matcher.graph import _parse_result_from_messages
+        from langchain_core.messages import AIMessage
+
+        content = 'Done {see notes}: {"exact_match": {"name": "Real {Co}"}, "suggestions": []}'
+        result = _parse_result_from_messages([AIMessage(content=content)])
+
+        assert result == '{"exact_match": {"name": "Real {Co}"}, "suggestions": []}'
+
     def test_parse_result_from_messages_no_json(self):
         """Test _parse_result_from_messages returns empty dict on no JSON."""
         from company_matcher.graph import _parse_result_from_messages
@@ -157,6 +167,32 @@ End of response."""
         
         assert result == {"category": "Hosting"}
 
+    def test_parse_json_recovers_truncated_response(self):
+        """Test _parse_json salvages a response cut off mid-object."""
+        from service_categorizer.graph import _parse_json
+        
+        text = """```json
+{"territorial_scope": {"is_in_scope": true, "reasoning": "Established in the EU"}, "summary": "The service is a hos"""
+        result = _parse_json(text)
+        
+        assert result["territorial_scope"]["is_in_scope"] is True
+        assert result["summary"] == "The service is a hos"
+
+    def test_parse_json_checked_flags_repair(self):
+        """Test _parse_json_checked reports only salvaged responses as repaired."""
+        from service_categorizer.graph import _parse_json_checked
+        
+        assert _parse_json_checked('{"a": 1}') == ({"a": 1}, False)
+        assert _parse_json_checked('{"a": [1, 2') == ({"a": [1, 2]}, True)
+
+    def test_parse_json_raises_on_non_json(self):
+        """Test _parse_json raises a JSONDecodeError when there is no JSON."""
+        import json
+        from service_categorizer.graph import _parse_json
+        
+        with pytest.raises(json.JSONDecodeError):
+            _parse_json("I cannot classify this company.")
+
 
 class TestCompanyResearcherUtils:
     """Tests for company_researcher utility functions."""